@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any, Dict
 
 from .flight import Flight
 from .log import get_logger
+from .notification_handler import wait_for_notifications
 from .utils import (
     AirportCheckInError,
     DriverTimeoutError,
@@ -51,6 +52,8 @@ class CheckInHandler:
 
     def schedule_check_in(self) -> None:
         logger.debug("Scheduling check-in for current flight")
+        # The notification worker thread can't be running while the process is forked
+        wait_for_notifications()
         process = Process(target=self._set_check_in)
         process.start()
         self.pid = process.pid
@@ -77,11 +80,8 @@ class CheckInHandler:
         logger.debug("Process with PID %d successfully terminated", self.pid)
 
     def _set_check_in(self) -> None:
-        # Check-in is 24 hours before the flight departs
-        checkin_time = self.flight.departure_time - timedelta(days=1)
-
         try:
-            self._wait_for_check_in(checkin_time)
+            self._wait_for_check_in(self.flight.checkin_time)
             self._check_in()
         except KeyboardInterrupt:
             # This is handled in the Reservation Monitor attached to this Checkin Handler
@@ -115,7 +115,8 @@ class CheckInHandler:
             logger.debug("Lock released")
             current_time = get_current_time()
 
-        sleep_time = (checkin_time - current_time).total_seconds()
+        # Refreshing the headers can take long enough for the check-in time to pass
+        sleep_time = max((checkin_time - current_time).total_seconds(), 0)
         logger.debug("Sleeping until check-in: %d seconds...", sleep_time)
         time.sleep(sleep_time)
 
@@ -202,12 +203,17 @@ class CheckInHandler:
         site = CHECKIN_URL + self.flight.confirmation_number
 
         logger.debug("Making first POST request to check in")
-        # Don't randomly sleep during the check-in requests to have them go through more quickly
-        response = make_request("POST", site, headers, info, random_sleep=False)
+        # Don't randomly sleep during the check-in requests to have them go through more quickly.
+        # Southwest returns client errors until check-in opens, so they are retried as well
+        response = make_request(
+            "POST", site, headers, info, random_sleep=False, retry_client_errors=True
+        )
 
         info = response["checkInViewReservationPage"]["_links"]["checkIn"]
         site = f"mobile-air-operations{info['href']}"
 
         logger.debug("Making second POST request to check in")
-        reservation = make_request("POST", site, headers, info["body"], random_sleep=False)
+        reservation = make_request(
+            "POST", site, headers, info["body"], random_sleep=False, retry_client_errors=True
+        )
         return reservation
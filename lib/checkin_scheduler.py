@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Dict, List
 
@@ -17,6 +18,9 @@ logger = get_logger(__name__)
 
 FLIGHT_IN_PAST_CODE = 400520413
 
+# Maximum number of reservations retrieved at the same time
+MAX_RETRIEVAL_WORKERS = 4
+
 
 class CheckInScheduler:
     """
@@ -37,9 +41,12 @@ class CheckInScheduler:
         Flights from all confirmation numbers are retrieved. Then, any new
         flights are scheduled and any flights now longer found are removed.
         """
+        # Retrieving a reservation only waits on Southwest's servers, so retrieve them concurrently.
+        # The flights are still kept in the same order as the confirmation numbers
         flights = []
-        for confirmation_number in confirmation_numbers:
-            flights.extend(self._get_flights(confirmation_number))
+        with ThreadPoolExecutor(max_workers=MAX_RETRIEVAL_WORKERS) as executor:
+            for reservation_flights in executor.map(self._get_flights, confirmation_numbers):
+                flights.extend(reservation_flights)
 
         logger.debug("%d total flights were found", len(flights))
         self._update_scheduled_flights(flights)
@@ -79,7 +86,9 @@ class CheckInScheduler:
 
         try:
             logger.debug("Retrieving reservation information")
-            response = make_request("POST", site, self.headers, info)
+            # A failed retrieval removes the reservation's scheduled check-ins, so a temporary
+            # client error can't be allowed to fail it
+            response = make_request("POST", site, self.headers, info, retry_client_errors=True)
         except RequestError as err:
             # Don't send a notification if flights have already been scheduled and all flights
             # from this reservation are old. This is how old flights are removed.
@@ -112,15 +121,16 @@ class CheckInScheduler:
             "Updating scheduled flights (%d scheduled, %d found)", len(self.flights), len(flights)
         )
 
+        scheduled_flights = {flight: flight for flight in self.flights}
         new_flights = []
         for flight in flights:
-            try:
-                matching_flight_idx = self.flights.index(flight)
-                # Flight has already been scheduled, so update the cached reservation info
-                self.flights[matching_flight_idx].reservation_info = flight.reservation_info
-            except ValueError:
+            scheduled_flight = scheduled_flights.get(flight)
+            if scheduled_flight is None:
                 # Flight has not been scheduled yet
                 new_flights.append(flight)
+            else:
+                # Flight has already been scheduled, so update the cached reservation info
+                scheduled_flight.reservation_info = flight.reservation_info
 
         logger.debug("%d new flights found", len(new_flights))
         self._schedule_flights(new_flights)
@@ -144,22 +154,25 @@ class CheckInScheduler:
 
         twenty_four_hr_time = self.reservation_monitor.config.notification_24_hour_time
 
-        # Copy the list because it can potentially change inside the loop
-        for flight in self.flights[:]:
-            if flight in flights:
+        current_flights = set(flights)
+        scheduled_flights = []
+        checkin_handlers = []
+        for flight, checkin_handler in zip(self.flights, self.checkin_handlers):
+            if flight in current_flights:
+                scheduled_flights.append(flight)
+                checkin_handlers.append(checkin_handler)
                 continue
 
-            flight_idx = self.flights.index(flight)
             flight_time = flight.get_display_time(twenty_four_hr_time)
             print(
                 f"Flight from {flight.departure_airport} to {flight.destination_airport} on "
                 f"{flight_time} is no longer scheduled. Stopping its check-in\n"
             )  # Don't log as it has sensitive information
 
-            self.checkin_handlers[flight_idx].stop_check_in()
+            checkin_handler.stop_check_in()
 
-            self.checkin_handlers.pop(flight_idx)
-            self.flights.pop(flight_idx)
+        self.flights = scheduled_flights
+        self.checkin_handlers = checkin_handlers
 
         logger.debug(
             "Successfully removed old flights. %d flights are now scheduled", len(self.flights)
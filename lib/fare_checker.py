@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import itertools
+import time
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from .flight import Flight
 from .log import get_logger
-from .utils import CheckFaresOption, FlightChangeError, make_request
+from .utils import CheckFaresOption, FlightChangeError, RateLimiter, make_request
 
 if TYPE_CHECKING:
     from .reservation_monitor import ReservationMonitor
@@ -13,15 +15,35 @@ if TYPE_CHECKING:
 JSON = Dict[str, Any]
 
 BOOKING_URL = "mobile-air-booking/"
+BOUNDS = ("outbound", "inbound")
+# Translation table to remove the thousands separators from fare amounts
+REMOVE_COMMAS = str.maketrans("", "", ",")
+# Minimum time between requests to Southwest when checking fares concurrently
+REQUEST_INTERVAL_SECONDS = 0.5
+# How long a reservation's change flight page is reused for its other flights
+CHANGE_FLIGHT_PAGE_CACHE_SECONDS = 60
+
 logger = get_logger(__name__)
 
 
 class FareChecker:
+    # Shared between every FareChecker in the process so all fare checks are paced together
+    rate_limiter = RateLimiter(REQUEST_INTERVAL_SECONDS)
+
     def __init__(self, reservation_monitor: ReservationMonitor) -> None:
         self.reservation_monitor = reservation_monitor
-        self.headers = reservation_monitor.checkin_scheduler.headers
         self.filter = get_fare_check_filter(self.reservation_monitor.config.check_fares)
 
+        # Round-trip reservations share the same change flight page for both flights, so
+        # cache it by confirmation number to avoid requesting it again for the second flight
+        self.change_flight_pages = {}
+
+    @property
+    def headers(self) -> JSON:
+        # The fare checker is reused between checks, but the headers are replaced every time they
+        # are refreshed, so always use the latest ones
+        return self.reservation_monitor.checkin_scheduler.headers
+
     def check_flight_price(self, flight: Flight) -> None:
         """
         Check if the price amount is negative (in either points or USD).
@@ -57,8 +79,8 @@ class FareChecker:
         Additionally, retrieve the flight's fare type so we can check the correct
         fare for a price drop.
         """
-        change_flight_page, fare_type_bounds = self._get_change_flight_page(flight.reservation_info)
-        query = self._get_search_query(change_flight_page, flight)
+        change_flight_page, fare_type_bounds = self._get_change_flight_page(flight)
+        query, bound = self._get_search_query(change_flight_page, flight)
 
         info = change_flight_page["_links"]["changeShopping"]
         site = BOOKING_URL + info["href"]
@@ -66,23 +88,15 @@ class FareChecker:
         # Southwest will not display the other page if its prices aren't requested. Therefore
         # we need to know what page to get based on what flight we requested (in case two flights
         # (round-trip flights) are on the same reservation)
-        if query.get("outbound", {}).get("isChangeBound"):
-            bound_page = "outboundPage"
-        elif query.get("inbound", {}).get("isChangeBound"):
-            bound_page = "inboundPage"
-        else:
-            # This exception usually happens when Southwest changes the formatting of their flight
-            # numbers
-            raise ValueError("Flight number did not match any flight bound on the reservation")
-
-        bound = 0 if bound_page == "outboundPage" else 1
+        bound_page = BOUNDS[bound] + "Page"
         fare_type = fare_type_bounds[bound]["fareProductDetails"]["fareProductId"]
 
         logger.debug("Retrieving matching flights")
-        response = make_request("POST", site, self.headers, query, max_attempts=7)
+        response = self._make_request("POST", site, query)
         return response["changeShoppingPage"]["flights"][bound_page]["cards"], fare_type
 
-    def _get_change_flight_page(self, reservation_info: JSON) -> Tuple[JSON, List[JSON]]:
+    def _get_change_flight_page(self, flight: Flight) -> Tuple[JSON, List[JSON]]:
+        reservation_info = flight.reservation_info
         fare_type_bounds = reservation_info["bounds"]
 
         # Ensure the flight does not have a companion pass connected to it
@@ -98,33 +112,61 @@ class FareChecker:
             raise FlightChangeError("Flight cannot be changed online")
 
         site = BOOKING_URL + change_link["href"]
-        response = make_request("GET", site, self.headers, change_link["query"], max_attempts=7)
+        cached_page = self.change_flight_pages.get(flight.confirmation_number)
+        if cached_page and time.monotonic() - cached_page[1] < CHANGE_FLIGHT_PAGE_CACHE_SECONDS:
+            logger.debug("Using cached search information for the current flight")
+            return cached_page[0], fare_type_bounds
+
+        response = self._make_request("GET", site, change_link["query"])
 
-        return response["changeFlightPage"], fare_type_bounds
+        change_flight_page = response["changeFlightPage"]
+        self.change_flight_pages[flight.confirmation_number] = (
+            change_flight_page,
+            time.monotonic(),
+        )
+        return change_flight_page, fare_type_bounds
 
-    def _get_search_query(self, flight_page: JSON, flight: Flight) -> JSON:
+    def _make_request(self, method: str, site: str, info: JSON) -> JSON:
+        """
+        Make a request for the fare check. The requests are spaced out so Southwest isn't sent a
+        burst of requests.
+        """
+        self.rate_limiter.wait()
+        return make_request(method, site, self.headers, info, max_attempts=7)
+
+    def _get_search_query(self, flight_page: JSON, flight: Flight) -> Tuple[JSON, int]:
         """
         Generate the search query needed to get matching flights. The search query
-        is different if the reservation is one-way vs. round-trip
+        is different if the reservation is one-way vs. round-trip.
+
+        The index of the bound the flight is on is also returned so the correct page
+        can be retrieved.
         """
         bound_references = flight_page["_links"]["changeShopping"]["body"]
-        search_terms = []
-        for idx, bound in enumerate(flight_page["boundSelections"]):
-            search_terms.append(
-                {
-                    "boundReference": bound_references[idx]["boundReference"],
-                    "date": bound["originalDate"],
-                    "destination-airport": bound["toAirportCode"],
-                    "origin-airport": bound["fromAirportCode"],
-                    # This allows selecting the correct flight for a round-trip reservation.
-                    "isChangeBound": bound["flight"] == flight.flight_number,
-                }
-            )
 
         # Only generate a query including both 'outbound' and 'inbound' if the reservation
         # is round-trip. Otherwise, just generate a query including 'outbound'
-        bounds = ["outbound", "inbound"]
-        return dict(zip(bounds, search_terms))
+        query = {
+            BOUNDS[idx]: {
+                "boundReference": bound_references[idx]["boundReference"],
+                "date": bound["originalDate"],
+                "destination-airport": bound["toAirportCode"],
+                "origin-airport": bound["fromAirportCode"],
+                # This allows selecting the correct flight for a round-trip reservation.
+                "isChangeBound": bound["flight"] == flight.flight_number,
+            }
+            for idx, bound in enumerate(flight_page["boundSelections"])
+        }
+
+        change_bound = next(
+            (idx for idx, terms in enumerate(query.values()) if terms["isChangeBound"]), None
+        )
+        if change_bound is None:
+            # This exception usually happens when Southwest changes the formatting of their flight
+            # numbers
+            raise ValueError("Flight number did not match any flight bound on the reservation")
+
+        return query, change_bound
 
     def _check_for_companion(self, reservation_info: JSON) -> None:
         grey_box_message = reservation_info["greyBoxMessage"]
@@ -136,21 +178,31 @@ class FareChecker:
         Get the lowest fare for the queried flights based on the filter being used. If no fare is
         available for the specific fare type, a 0 USD difference will be returned.
         """
-        lowest_fare = None
-
-        for new_flight in flights:
-            # Only compare flight fares that match the current filter
-            if self.filter(flight, new_flight):
-                fare = self._get_matching_fare(new_flight["fares"], fare_type)
-                # Check if this fare is the lowest encountered so far
-                if (
-                    not lowest_fare
-                    # pylint: disable-next=unsubscriptable-object
-                    or (fare and fare["amount"] < lowest_fare["amount"])
-                ):
-                    lowest_fare = fare
-
-        if not lowest_fare:
+        # Bind the filter locally as it is called for every flight. Every flight matches the
+        # any_flight_filter, so it doesn't need to be called at all
+        fare_filter = self.filter
+        match_all = fare_filter is any_flight_filter
+
+        # Only compare flight fares that match the current filter
+        matching_flights = (
+            new_flight for new_flight in flights if match_all or fare_filter(flight, new_flight)
+        )
+        if fare_filter is same_flight_filter:
+            # Only one flight can match the current flight's flight number, so there is no
+            # need to check the rest of the flights
+            matching_flights = itertools.islice(matching_flights, 1)
+
+        fares = (
+            self._get_matching_fare(new_flight["fares"], fare_type)
+            for new_flight in matching_flights
+        )
+        lowest_fare = min(
+            (fare for fare in fares if fare is not None),
+            key=lambda fare: fare["amount"],
+            default=None,
+        )
+
+        if lowest_fare is None:
             # No fares are available (most likely due to tickets of that fare type
             # not being sold anymore). Therefore, report back a 0 USD difference.
             logger.debug("Fare %s is not available. Setting price difference to 0 USD", fare_type)
@@ -164,21 +216,19 @@ class FareChecker:
         an integer, and the currency code (USD or points). If no fare exists, nothing will be
         returned.
         """
-        if fares is None:
-            fares = []
+        fares = fares or []
+        fare = next((fare for fare in fares if fare["_meta"]["fareProductId"] == fare_type), None)
 
-        for fare in fares:
-            if fare["_meta"]["fareProductId"] == fare_type:
-                if "priceDifference" in fare:
-                    flight_price = fare["priceDifference"]
-                    # Format the amount correctly
-                    sign = flight_price.get("sign", "")
-                    parsed_amount = int(sign + flight_price["amount"].replace(",", ""))
-                    return {"amount": parsed_amount, "currencyCode": flight_price["currencyCode"]}
+        if fare is None or "priceDifference" not in fare:
+            return None
 
-                break
+        flight_price = fare["priceDifference"]
+        # Format the amount correctly
+        parsed_amount = int(flight_price["amount"].translate(REMOVE_COMMAS))
+        if flight_price.get("sign") == "-":
+            parsed_amount = -parsed_amount
 
-        return None
+        return {"amount": parsed_amount, "currencyCode": flight_price["currencyCode"]}
 
 
 def get_fare_check_filter(check_fares: CheckFaresOption) -> Callable[[Flight, JSON], bool]:
@@ -2,15 +2,25 @@ from __future__ import annotations
 
 import json
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
-
-import pytz
+from typing import Any, Dict, Tuple
+from zoneinfo import ZoneInfo
 
 JSON = Dict[str, Any]
 
 TZ_FILE_PATH = "utils/airport_timezones.json"
+# Every flight needs its departure airport's timezone, so only read the timezone file once
+AIRPORT_TIMEZONES = json.loads((Path(__file__).parents[1] / TZ_FILE_PATH).read_text())
+
+# Formats used to display a flight's departure time. The '#' removes leading zeros in Windows
+# and '-' in Linux/Mac
+DISPLAY_FORMAT_12_HR = "%Y-%m-%d " + ("%#I" if os.name == "nt" else "%-I") + ":%M %p %Z"
+DISPLAY_FORMAT_24_HR = "%Y-%m-%d %H:%M %Z"
+
+# Check-in opens 24 hours before a flight departs
+CHECKIN_OFFSET = timedelta(days=1)
 
 
 class Flight:
@@ -20,6 +30,20 @@ class Flight:
     The flight time is automatically translated from the flight's local timezone to UTC.
     """
 
+    # Flights are created for every reservation each time it is retrieved, so avoid giving every
+    # instance its own __dict__
+    __slots__ = (
+        "confirmation_number",
+        "departure_airport",
+        "destination_airport",
+        "flight_number",
+        "is_same_day",
+        "reservation_info",
+        "is_international",
+        "_local_departure_time",
+        "departure_time",
+    )
+
     def __init__(self, flight_info: JSON, reservation_info: JSON, confirmation_number: str) -> None:
         self.confirmation_number = confirmation_number
         self.departure_airport = flight_info["departureAirport"]["name"]
@@ -46,35 +70,35 @@ class Flight:
             and self.departure_time == other.departure_time
         )
 
-    def get_display_time(self, twenty_four_hr_time: bool) -> str:
-        if twenty_four_hr_time:
-            time_format = "%H:%M"
-        else:
-            # The '#' removes leading zeros in Windows and '-' in Linux/Mac
-            time_format = "%#I:%M %p" if os.name == "nt" else "%-I:%M %p"
+    def __hash__(self) -> int:
+        # Equal flights must have the same hash so flights can be looked up in sets and dicts
+        return hash((self.flight_number, self.departure_time))
+
+    @property
+    def checkin_time(self) -> datetime:
+        """The time check-in opens for this flight, in UTC"""
+        return self.departure_time - CHECKIN_OFFSET
 
-        date_format = f"%Y-%m-%d {time_format} %Z"
-        return datetime.strftime(self._local_departure_time, date_format)
+    def get_display_time(self, twenty_four_hr_time: bool) -> str:
+        date_format = DISPLAY_FORMAT_24_HR if twenty_four_hr_time else DISPLAY_FORMAT_12_HR
+        return self._local_departure_time.strftime(date_format)
 
     def _set_flight_time(self, flight: JSON) -> None:
-        flight_date = f"{flight['departureDate']} {flight['departureTime']}"
         departure_airport_code = flight["departureAirport"]["code"]
         airport_timezone = self._get_airport_timezone(departure_airport_code)
-        self.departure_time = self._convert_to_utc(flight_date, airport_timezone)
-
-    def _get_airport_timezone(self, airport_code: str) -> Any:
-        project_dir = Path(__file__).parents[1]
-        tz_file = project_dir / TZ_FILE_PATH
-        airport_timezones = json.loads(tz_file.read_text())
-
-        airport_timezone = pytz.timezone(airport_timezones[airport_code])
-        return airport_timezone
+        self.departure_time = self._convert_to_utc(
+            flight["departureDate"], flight["departureTime"], airport_timezone
+        )
 
-    def _convert_to_utc(self, flight_date: str, airport_timezone: Any) -> datetime:
-        flight_date = datetime.strptime(flight_date, "%Y-%m-%d %H:%M")
-        self._local_departure_time = airport_timezone.localize(flight_date)
+    def _get_airport_timezone(self, airport_code: str) -> ZoneInfo:
+        return ZoneInfo(AIRPORT_TIMEZONES[airport_code])
 
-        utc_time = self._local_departure_time.astimezone(timezone.utc).replace(tzinfo=None)
+    def _convert_to_utc(
+        self, departure_date: str, departure_time: str, airport_timezone: ZoneInfo
+    ) -> datetime:
+        self._local_departure_time, utc_time = convert_to_utc(
+            departure_date, departure_time, airport_timezone
+        )
         return utc_time
 
     def _get_flight_number(self, flights: JSON) -> str:
@@ -83,12 +107,30 @@ class Flight:
         'WN' prefix removed and a slash separating each number with a zero-width space on either
         side.
         """
-        flight_number = ""
-        for flight in flights:
-            # Remove the 'WN' prefix from each flight number
-            flight_number += flight["number"].replace("WN", "", 1)
-            # Add a slash with a zero-width space on either side
-            flight_number += "\u200b/\u200b"
-
-        # Remove any slashes and zero-width spaces from the end
-        return flight_number.rstrip("/\u200b")
+        return "\u200b/\u200b".join(flight["number"].replace("WN", "", 1) for flight in flights)
+
+
+@lru_cache(maxsize=256)
+def convert_to_utc(
+    departure_date: str, departure_time: str, airport_timezone: ZoneInfo
+) -> Tuple[datetime, datetime]:
+    """
+    Returns the flight's local departure time and its departure time in UTC. The same flights are
+    parsed every time their reservation is retrieved, so the results are cached.
+    """
+    # The date is always formatted as "%Y-%m-%d" and the time as "%H:%M", so slice them directly as
+    # it is much faster than datetime.strptime
+    local_time = datetime(
+        int(departure_date[0:4]),
+        int(departure_date[5:7]),
+        int(departure_date[8:10]),
+        int(departure_time[0:2]),
+        int(departure_time[3:5]),
+        tzinfo=airport_timezone,
+        # A time that occurs twice when daylight saving time ends is treated as standard time, the
+        # same as pytz's localize(is_dst=False) did
+        fold=1,
+    )
+
+    utc_time = local_time.astimezone(timezone.utc).replace(tzinfo=None)
+    return local_time, utc_time
@@ -9,6 +9,20 @@ LOGS_DIRECTORY = Path(__file__).parents[1] / "logs"
 LOG_FILE = "auto-southwest-check-in.log"
 LOG_LEVEL = logging.INFO
 
+# When processes are started using the spawn method, their logger
+# configuration will not get copied over (unlike the fork start method).
+# Therefore, the configuration has to be reapplied in every child process.
+# This can't change within a process, so it is only checked once.
+NEEDS_LOGGING_INIT = (
+    multiprocessing.get_start_method() == "spawn"
+    and multiprocessing.current_process().name != "MainProcess"
+)
+
+# Whether to print debug logs to the console. In 'spawn' start methods, global variables won't be
+# copied from the parent process, so this is evaluated from the arguments (which are copied to child
+# processes) once when this module is imported
+VERBOSE = bool({"--verbose", "-v"}.intersection(sys.argv[1:]))
+
 
 def init_main_logging() -> None:
     """
@@ -45,12 +59,7 @@ def init_logging(logger: logging.Logger) -> None:
 
     stream_handler = logging.StreamHandler()
 
-    # Retrieve the arguments again to set the correct logging level
-    # in child processes. In 'spawn' start methods, global variables
-    # won't be copied, so getting the log level from the parent process
-    # is complicated. Therefore, it is evaluated from the arguments.
-    arguments = sys.argv[1:]
-    if "--verbose" in arguments or "-v" in arguments:
+    if VERBOSE:
         stream_handler.setLevel(logging.DEBUG)
         stream_handler.setFormatter(formatter)
     else:
@@ -68,13 +77,8 @@ def get_logger(name: str) -> logging.Logger:
     """
     logger = logging.getLogger(name)
 
-    # When processes are started using the spawn method, their logger
-    # configuration will not get copied over (unlike the fork start method).
-    # Therefore, the configuration has to be reapplied for every child process.
-    if (
-        multiprocessing.get_start_method() == "spawn"
-        and multiprocessing.current_process().name != "MainProcess"
-    ):
+    # Don't add the handlers again if this logger has already been retrieved
+    if NEEDS_LOGGING_INIT and not logger.handlers:
         init_logging(logger)
 
     return logger
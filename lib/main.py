@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib
 import multiprocessing
 import sys
 from typing import List
@@ -12,6 +13,8 @@ from .config import GlobalConfig, ReservationConfig
 from .reservation_monitor import AccountMonitor, ReservationMonitor
 
 LOG_FILE = "logs/auto-southwest-check-in.log"
+# Flags that are handled elsewhere and need to be removed before the arguments are parsed
+FLAGS_TO_REMOVE = frozenset({"--debug-screenshots", "-v", "--verbose"})
 
 logger = log.get_logger(__name__)
 
@@ -22,17 +25,16 @@ def get_notification_urls(config: GlobalConfig) -> List[str]:
     reservation. Removes duplicates so notifications are not sent twice to
     the same source.
     """
-    notification_urls = config.notification_urls
+    # Use a set to remove duplicates as the URLs are added
+    notification_urls = set(config.notification_urls)
 
     for account in config.accounts:
-        notification_urls.extend(account.notification_urls)
+        notification_urls.update(account.notification_urls)
 
     for reservation in config.reservations:
-        notification_urls.extend(reservation.notification_urls)
+        notification_urls.update(reservation.notification_urls)
 
-    # Remove duplicates
-    notification_urls = list(set(notification_urls))
-    return notification_urls
+    return list(notification_urls)
 
 
 def test_notifications(config: GlobalConfig) -> None:
@@ -46,6 +48,16 @@ def test_notifications(config: GlobalConfig) -> None:
     reservation_monitor.notification_handler.send_notification("This is a test message")
 
 
+def preload_apprise(config: GlobalConfig) -> None:
+    """
+    Apprise is only imported once a notification is sent through it. When notifications are
+    configured, import it before the monitors are started so forked monitors inherit it instead of
+    each importing it again. Spawned monitors still import it themselves
+    """
+    if get_notification_urls(config):
+        importlib.import_module("apprise")
+
+
 def pluralize(word: str, count: int) -> str:
     """Pluralize a word to improve grammar for printed messages"""
     return word if count == 1 else word + "s"
@@ -98,6 +110,7 @@ def set_up_check_in(arguments: List[str]) -> None:
         f"Monitoring {num_accounts} {pluralize('account', num_accounts)} and {num_reservations} "
         f"{pluralize('reservation', num_reservations)}\n"
     )
+    preload_apprise(config)
     lock = multiprocessing.Lock()
     set_up_accounts(config, lock)
     set_up_reservations(config, lock)
@@ -113,8 +126,7 @@ def main(arguments: List[str], version: str) -> None:
     logger.debug("Auto-Southwest Check-In %s", version)
 
     # Remove flags now that they are not needed (and will mess up parsing)
-    flags_to_remove = ["--debug-screenshots", "-v", "--verbose"]
-    arguments = [x for x in arguments if x not in flags_to_remove]
+    arguments = [x for x in arguments if x not in FLAGS_TO_REMOVE]
 
     try:
         set_up_check_in(arguments)
@@ -1,24 +1,55 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, List
 
-import apprise
 import requests
 
+from . import utils
 from .flight import Flight
 from .log import get_logger
 from .utils import LoginError, NotificationLevel, RequestError
 
 if TYPE_CHECKING:
+    import apprise
+
     from .reservation_monitor import ReservationMonitor
 
 MANUAL_CHECKIN_URL = "https://mobile.southwest.com/check-in"
 MANAGE_RESERVATION_URL_MOBILE = "https://mobile.southwest.com/view-reservation"
 MANAGE_RESERVATION_URL_DESKTOP = "https://www.southwest.com/air/manage-reservation/"
 
+NOTIFICATION_TITLE = "Auto Southwest Check-in Script"
+
 logger = get_logger(__name__)
 
 
+def create_executor() -> ThreadPoolExecutor:
+    """
+    Notifications are sent in the background so monitoring and check-ins don't wait on the
+    notification services. A single worker keeps the notifications in the order they were sent.
+    Pending notifications are still sent before the process exits
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="notification")
+
+
+EXECUTOR = create_executor()
+utils.recreate_after_fork(globals(), "EXECUTOR", create_executor)
+
+
+def wait_for_notifications() -> None:
+    """
+    Wait for the notifications being sent in the background and stop the executor's worker
+    thread. This needs to be called before forking a process, as the child would otherwise inherit
+    any lock held by the worker (e.g. a logging handler's or a connection pool's lock) with no
+    thread left to release it. The new executor only starts a worker once something is submitted
+    """
+    global EXECUTOR
+    EXECUTOR.shutdown()
+    EXECUTOR = create_executor()
+
+
 class NotificationHandler:
     """Handles all notifications that will be sent to the user either via Apprise or the console"""
 
@@ -26,50 +57,71 @@ class NotificationHandler:
         self.reservation_monitor = reservation_monitor
         self.notification_urls = reservation_monitor.config.notification_urls
         self.notification_level = reservation_monitor.config.notification_level
+        # Set once the account's name is known, as it doesn't change afterwards
+        self.account_name = None
 
     def send_notification(self, body: str, level: NotificationLevel = None) -> None:
         print(body)  # This isn't logged as it contains sensitive information
 
         # Check the level to see if we still want to send it. If level is none, it means
         # the message will always be printed. For example, this is used when testing notifications.
-        if level and level < self.notification_level:
+        if level is not None and level < self.notification_level:
+            return
+
+        # Printing the notification is enough when no notification URLs are configured
+        if not self.notification_urls:
             return
 
-        title = "Auto Southwest Check-in Script"
+        # Apprise loads every notification service it supports when it is imported, so it is
+        # only imported once a notification needs to be sent through it
+        # pylint:disable-next=import-outside-toplevel,redefined-outer-name
+        import apprise
 
-        apobj = apprise.Apprise(self.notification_urls)
-        apobj.notify(title=title, body=body, body_format=apprise.NotifyFormat.TEXT)
+        EXECUTOR.submit(
+            self.apprise_object.notify,
+            title=NOTIFICATION_TITLE,
+            body=body,
+            body_format=apprise.NotifyFormat.TEXT,
+        )
+
+    @cached_property
+    def apprise_object(self) -> apprise.Apprise:
+        """
+        The notification URLs are parsed and validated when the Apprise object is created, so
+        create it on the first notification and reuse it afterwards
+        """
+        # pylint:disable-next=import-outside-toplevel,redefined-outer-name
+        import apprise
+
+        return apprise.Apprise(self.notification_urls)
 
     def new_flights(self, flights: List[Flight]) -> None:
         # Don't send notifications if no new flights are scheduled
         if len(flights) == 0:
             return
 
-        is_international = False
         twenty_four_hr_time = self.reservation_monitor.config.notification_24_hour_time
-        flight_schedule_message = (
+        message_parts = [
             "Successfully scheduled the following flights to check in for "
             f"{self._get_account_name()}:\n"
-        )
+        ]
         for flight in flights:
             flight_time = flight.get_display_time(twenty_four_hr_time)
-            flight_schedule_message += (
+            message_parts.append(
                 f"Flight from {flight.departure_airport} to {flight.destination_airport} on "
                 f"{flight_time}\n"
             )
-            if flight.is_international:
-                is_international = True
 
-        if is_international:
+        if any(flight.is_international for flight in flights):
             # Add an extra message for international flights to make sure people fill out their
             # passport information.
-            flight_schedule_message += (
+            message_parts.append(
                 "\nInternational flights were scheduled. Make sure to fill out your passport "
                 "information before the check-in date\n"
             )
 
         logger.debug("Sending new flights notification")
-        self.send_notification(flight_schedule_message, NotificationLevel.INFO)
+        self.send_notification("".join(message_parts), NotificationLevel.INFO)
 
     def failed_reservation_retrieval(self, error: RequestError, confirmation_number: str) -> None:
         error_message = (
@@ -103,21 +155,21 @@ class NotificationHandler:
         self.send_notification(error_message, NotificationLevel.ERROR)
 
     def successful_checkin(self, boarding_pass: Dict[str, Any], flight: Flight) -> None:
-        success_message = (
+        message_parts = [
             f"Successfully checked in to flight from '{flight.departure_airport}' to "
             f"'{flight.destination_airport}' for {self._get_account_name()}!\n"
-        )
+        ]
 
         for flight_info in boarding_pass["flights"]:
             for passenger in flight_info["passengers"]:
                 if passenger["boardingGroup"] is not None:
-                    success_message += (
+                    message_parts.append(
                         f"{passenger['name']} got "
                         f"{passenger['boardingGroup']}{passenger['boardingPosition']}!\n"
                     )
 
         logger.debug("Sending successful check-in notification...")
-        self.send_notification(success_message, NotificationLevel.INFO)
+        self.send_notification("".join(message_parts), NotificationLevel.INFO)
 
     def failed_checkin(self, error: RequestError, flight: Flight) -> None:
         error_message = (
@@ -163,13 +215,33 @@ class NotificationHandler:
 
     def healthchecks_success(self, data: str) -> None:
         if self.reservation_monitor.config.healthchecks_url is not None:
-            requests.post(self.reservation_monitor.config.healthchecks_url, data=data)
+            EXECUTOR.submit(
+                self._ping_healthchecks, self.reservation_monitor.config.healthchecks_url, data
+            )
 
     def healthchecks_fail(self, data: str) -> None:
         if self.reservation_monitor.config.healthchecks_url is not None:
-            requests.post(self.reservation_monitor.config.healthchecks_url + "/fail", data=data)
+            EXECUTOR.submit(
+                self._ping_healthchecks,
+                self.reservation_monitor.config.healthchecks_url + "/fail",
+                data,
+            )
+
+    def _ping_healthchecks(self, url: str, data: str) -> None:
+        """
+        Healthchecks are pinged in the background every monitoring interval, so the shared session
+        is used to keep the connection alive between pings. Errors are logged as nothing else
+        would see them, so a broken Healthchecks URL still shows up in the logs
+        """
+        try:
+            utils.SESSION.post(url, data=data, timeout=utils.REQUEST_TIMEOUT)
+        except requests.RequestException as err:
+            logger.error("Failed to ping Healthchecks: %s", err)
 
     def _get_account_name(self) -> str:
+        if self.account_name is not None:
+            return self.account_name
+
         # hasattr has to be used instead of isinstance to avoid a circular import
         if (
             hasattr(self.reservation_monitor, "username")
@@ -179,4 +251,7 @@ class NotificationHandler:
             # have a name set, but check if it is an AccountMonitor (through hasattr) just in case
             return self.reservation_monitor.username
 
-        return f"{self.reservation_monitor.first_name} {self.reservation_monitor.last_name}"
+        self.account_name = (
+            f"{self.reservation_monitor.first_name} {self.reservation_monitor.last_name}"
+        )
+        return self.account_name
@@ -1,12 +1,14 @@
 import multiprocessing
 import sys
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Any, Dict, List, Tuple, Union
 
 from .checkin_scheduler import CheckInScheduler
 from .config import AccountConfig, ReservationConfig
 from .fare_checker import FareChecker
+from .flight import Flight
 from .log import get_logger
 from .notification_handler import NotificationHandler
 from .utils import (
@@ -15,12 +17,18 @@ from .utils import (
     FlightChangeError,
     LoginError,
     RequestError,
-    get_current_time,
 )
 from .webdriver import WebDriver
 
 TOO_MANY_REQUESTS_CODE = 429
 
+# Maximum number of reservations whose fares are checked at the same time
+MAX_FARE_CHECK_WORKERS = 5
+# After the first check, the fraction of the retrieval interval a monitor waits for the lock before
+# skipping its check until the next interval. This keeps one stuck monitor from stalling every
+# other monitor
+LOCK_TIMEOUT_INTERVAL_FRACTION = 0.1
+
 logger = get_logger(__name__)
 
 
@@ -38,8 +46,18 @@ class ReservationMonitor:
 
         self.config = config
         self.lock = lock
-        self.notification_handler = NotificationHandler(self)
-        self.checkin_scheduler = CheckInScheduler(self)
+        # Created on the first fare check and reused afterwards
+        self.fare_checker = None
+
+    # The notification handler and check-in scheduler are only created once they are needed.
+    # Testing notifications never uses the check-in scheduler, for example
+    @cached_property
+    def notification_handler(self) -> NotificationHandler:
+        return NotificationHandler(self)
+
+    @cached_property
+    def checkin_scheduler(self) -> CheckInScheduler:
+        return CheckInScheduler(self)
 
     def start(self) -> None:
         """Start each reservation monitor in a separate process to run them in parallel"""
@@ -58,13 +76,20 @@ class ReservationMonitor:
 
     def _monitor(self) -> None:
         """Continuously performs checks every X hours (the retrieval interval)"""
+        first_check = True
         while True:
-            time_before = get_current_time()
+            time_before = time.monotonic()
 
             # Acquire a lock to prevent concurrency issues with the webdriver
             logger.debug("Acquiring lock...")
-            with self.lock:
+            if not self._acquire_lock(first_check):
+                logger.warning("Timed out waiting for the lock. Skipping check until next interval")
+                self._smart_sleep(time_before)
+                continue
+
+            try:
                 logger.debug("Lock acquired")
+                first_check = False
 
                 should_exit = self._check()
                 if should_exit:
@@ -74,10 +99,24 @@ class ReservationMonitor:
                 if self.config.retrieval_interval <= 0:
                     logger.debug("Monitoring is disabled as retrieval interval is 0")
                     break
+            finally:
+                self.lock.release()
 
             logger.debug("Lock released")
             self._smart_sleep(time_before)
 
+    def _acquire_lock(self, first_check: bool) -> bool:
+        """
+        The first check always waits for the lock so the flights are scheduled. Afterwards, only
+        wait for part of the retrieval interval so a monitor that is stuck while holding the lock
+        doesn't stop every other monitor from checking. Returns true if the lock was acquired.
+        """
+        timeout = None
+        if not first_check:
+            timeout = self.config.retrieval_interval * LOCK_TIMEOUT_INTERVAL_FRACTION
+
+        return self.lock.acquire(timeout=timeout)
+
     def _check(self) -> bool:
         """
         Check for reservation changes and lower fares. Returns true if future checks should not be
@@ -105,7 +144,11 @@ class ReservationMonitor:
 
     def _schedule_reservations(self, reservations: List[Dict[str, Any]]) -> None:
         logger.debug("Scheduling flight check-ins for %d reservations", len(reservations))
-        confirmation_numbers = [reservation["confirmationNumber"] for reservation in reservations]
+        # A reservation can be listed more than once (e.g. one trip for each flight), but its
+        # flights only need to be retrieved once
+        confirmation_numbers = list(
+            dict.fromkeys(reservation["confirmationNumber"] for reservation in reservations)
+        )
         self.checkin_scheduler.process_reservations(confirmation_numbers)
 
     def _check_flight_fares(self) -> None:
@@ -115,39 +158,60 @@ class ReservationMonitor:
         flights = self.checkin_scheduler.flights
         logger.debug("Checking fares for %d flights", len(flights))
 
-        fare_checker = FareChecker(self)
+        if self.fare_checker is None:
+            self.fare_checker = FareChecker(self)
+        else:
+            # Change flight pages are only reused within a single fare check, so don't keep pages
+            # from the previous check (e.g. for reservations that no longer exist)
+            self.fare_checker.change_flight_pages.clear()
+
+        # Flights on the same reservation share the same change flight page, so they are checked
+        # one after another to reuse the cached page. Fare checks only wait on Southwest's
+        # servers, so each reservation is checked concurrently
+        reservation_flights = {}
         for flight in flights:
-            # If a fare check fails, don't completely exit. Just print the error
-            # and continue
-            try:
-                fare_checker.check_flight_price(flight)
-                self.notification_handler.healthchecks_success(
-                    f"Successful fare check,\nconfirmation number = {flight.confirmation_number}"
-                )
-            except RequestError as err:
-                logger.error("Requesting error during fare check. %s. Skipping...", err)
-                self.notification_handler.healthchecks_fail(
-                    f"Failed fare check,\nconfirmation number = {flight.confirmation_number}"
-                )
-            except FlightChangeError as err:
-                logger.debug("%s. Skipping fare check", err)
-                self.notification_handler.healthchecks_success(
-                    f"Successful fare check,\nconfirmation number = {flight.confirmation_number}"
-                )
-            except Exception as err:
-                logger.exception("Unexpected error during fare check: %s", repr(err))
-                self.notification_handler.healthchecks_fail(
-                    f"Failed fare check,\nconfirmation number = {flight.confirmation_number}"
-                )
+            reservation_flights.setdefault(flight.confirmation_number, []).append(flight)
+
+        with ThreadPoolExecutor(max_workers=MAX_FARE_CHECK_WORKERS) as executor:
+            for same_reservation_flights in reservation_flights.values():
+                executor.submit(self._check_reservation_fares, same_reservation_flights)
+
+    def _check_reservation_fares(self, flights: List[Flight]) -> None:
+        for flight in flights:
+            self._check_flight_fare(flight)
+
+    def _check_flight_fare(self, flight: Flight) -> None:
+        # If a fare check fails, don't completely exit. Just print the error
+        # and continue
+        try:
+            self.fare_checker.check_flight_price(flight)
+            self.notification_handler.healthchecks_success(
+                f"Successful fare check,\nconfirmation number = {flight.confirmation_number}"
+            )
+        except RequestError as err:
+            logger.error("Requesting error during fare check. %s. Skipping...", err)
+            self.notification_handler.healthchecks_fail(
+                f"Failed fare check,\nconfirmation number = {flight.confirmation_number}"
+            )
+        except FlightChangeError as err:
+            logger.debug("%s. Skipping fare check", err)
+            self.notification_handler.healthchecks_success(
+                f"Successful fare check,\nconfirmation number = {flight.confirmation_number}"
+            )
+        except Exception as err:
+            logger.exception("Unexpected error during fare check: %s", repr(err))
+            self.notification_handler.healthchecks_fail(
+                f"Failed fare check,\nconfirmation number = {flight.confirmation_number}"
+            )
 
-    def _smart_sleep(self, previous_time: datetime) -> None:
+    def _smart_sleep(self, previous_time: float) -> None:
         """
         Account for the time it took to do recurring tasks so the sleep interval
         is the exact time provided in the configuration file.
         """
-        current_time = get_current_time()
-        time_taken = (current_time - previous_time).total_seconds()
-        sleep_time = self.config.retrieval_interval - time_taken
+        time_taken = time.monotonic() - previous_time
+        # Don't sleep at all if the checks took longer than the retrieval interval
+        sleep_time = max(self.config.retrieval_interval - time_taken, 0)
         logger.debug("Sleeping for %d seconds", sleep_time)
         time.sleep(sleep_time)
 
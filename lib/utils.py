@@ -1,13 +1,18 @@
+import email.utils
+import http.cookiejar
 import json
+import os
 import random
 import socket
+import threading
 import time
 from datetime import datetime, timezone
 from enum import Enum, IntEnum
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 import ntplib
 import requests
+from requests.adapters import HTTPAdapter
 
 from .log import get_logger
 
@@ -23,9 +28,51 @@ INVALID_CONFIRMATION_NUMBER_LENGTH_CODE = 400310456
 PASSENGER_NOT_FOUND_CODE = 400620480
 RESERVATION_NOT_FOUND_CODE = 400620389
 
+# Base and maximum number of seconds to wait between request attempts when backing off
+RETRY_BASE_DELAY = 2
+RETRY_MAX_DELAY = 8
+# Longest Retry-After a request waits for. Requests can be made while holding the webdriver lock, so
+# a request that is asked to wait longer gives up instead of stalling every other monitor
+RETRY_AFTER_MAX_SECONDS = 30
+# Client errors that won't succeed by retrying the same request, unless the caller knows they are
+# temporary (e.g. Southwest returns errors until check-in opens)
+CLIENT_ERROR_STATUS_CODES = frozenset({400, 401, 403, 404})
+# Maximum number of connections kept alive to Southwest's servers
+POOL_SIZE = 10
+# Seconds to wait to connect to Southwest's servers and to wait for their response
+REQUEST_TIMEOUT = (5, 30)
+
 logger = get_logger(__name__)
 
 
+def recreate_after_fork(namespace: Dict[str, Any], name: str, factory: Callable[[], Any]) -> None:
+    """
+    Replace a module-level object with a new one in forked processes (e.g. check-in handlers). A
+    forked process must not share its parent's open connections and doesn't get its parent's
+    threads. Windows never forks processes
+    """
+    if hasattr(os, "register_at_fork"):  # pragma: no branch
+        os.register_at_fork(after_in_child=lambda: namespace.update({name: factory()}))
+
+
+def create_session() -> requests.Session:
+    """
+    Requests to Southwest are made through a session so connections are kept alive and reused
+    instead of doing a new TCP and TLS handshake for every request. Cookies are never stored, as
+    every request already sends the headers it needs and the session is shared by every account in
+    the process
+    """
+    session = requests.Session()
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = create_session()
+recreate_after_fork(globals(), "SESSION", create_session)
+
+
 def random_sleep_duration(min_duration: float, max_duration: float) -> float:
     return random.uniform(min_duration, max_duration)
 
@@ -45,51 +92,80 @@ def _handle_southwest_error_code(error: "RequestError") -> None:
 
 
 def make_request(
-    method: str, site: str, headers: JSON, info: JSON, max_attempts=20, random_sleep=True
+    method: str,
+    site: str,
+    headers: JSON,
+    info: JSON,
+    max_attempts=20,
+    random_sleep=True,
+    retry_client_errors=False,
 ) -> JSON:
     """
     Makes a request to the Southwest servers. For increased reliability, the request is performed
     multiple times on failure. This request retrying is also necessary for check-ins, as check-in
     requests are started five seconds ahead of the actual check-in time (in case the Southwest
-    server is not in sync with our NTP server or local computer).
+    server is not in sync with our NTP server or local computer). Client errors are only retried
+    when retry_client_errors is set.
     """
     # Ensure the URL is not malformed
     site = site.replace("//", "/").lstrip("/")
     url = BASE_URL + site
 
+    # The method doesn't change between attempts, so only decide how to send the request once
+    if method.upper() == "POST":
+        send_request = SESSION.post
+        request_data = {"json": info}
+    else:
+        send_request = SESSION.get
+        request_data = {"params": info}
+
     attempts = 0
     while attempts < max_attempts:
         attempts += 1
 
-        if method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=info)
+        try:
+            response = send_request(url, headers=headers, timeout=REQUEST_TIMEOUT, **request_data)
+        except (requests.ConnectionError, requests.Timeout) as err:
+            # The request never reached Southwest, so it is always worth retrying
+            response = None
+            response_body = ""
+            error_msg = f"Connection error ({err})"
+            error = RequestError(error_msg)
         else:
-            response = requests.get(url, headers=headers, params=info)
+            if response.status_code == 200:
+                logger.debug("Successfully made request after %d attempts", attempts)
+                return response.json()
 
-        if response.status_code == 200:
-            logger.debug("Successfully made request after %d attempts", attempts)
-            return response.json()
+            # Handle unsuccessful responses
+            response_body = response.content.decode()
+            error_msg = f"{response.reason} ({response.status_code})"
+            error = RequestError(error_msg, response_body)
 
-        # Handle unsuccessful responses
-        response_body = response.content.decode()
-        error_msg = f"{response.reason} ({response.status_code})"
-        error = RequestError(error_msg, response_body)
+            try:
+                _handle_southwest_error_code(error)
+            except (RequestError, AirportCheckInError) as err:
+                # Stop requesting after one attempt for special codes, as the requests won't succeed
+                error = err
+                break
 
-        try:
-            _handle_southwest_error_code(error)
-        except (RequestError, AirportCheckInError) as err:
-            # Stop requesting after one attempt for special codes, as the requests won't succeed
-            error = err
-            break
+            if not retry_client_errors and response.status_code in CLIENT_ERROR_STATUS_CODES:
+                break
 
         if random_sleep:
-            sleep_time = random_sleep_duration(1, 3)
+            retry_after = _get_retry_after(response)
+            if retry_after > RETRY_AFTER_MAX_SECONDS:
+                logger.debug("Southwest asked to retry after %.2f seconds. Giving up", retry_after)
+                break
+
+            sleep_time = max(_get_backoff_duration(attempts), retry_after)
         else:
             sleep_time = 0.5
 
         logger.debug(
-            f"Request error on attempt {attempts}: {error_msg}. Sleeping for {sleep_time:.2f} "
-            "seconds until next attempt"
+            "Request error on attempt %d: %s. Sleeping for %.2f seconds until next attempt",
+            attempts,
+            error_msg,
+            sleep_time,
         )
         time.sleep(sleep_time)
 
@@ -98,6 +174,60 @@ def make_request(
     raise error
 
 
+def _get_backoff_duration(attempts: int) -> float:
+    """
+    Get how long to wait before retrying a failed request. The wait grows exponentially with each
+    attempt (up to a maximum) so persistent failures aren't retried rapidly, and is randomized so
+    multiple processes don't retry at the same time.
+    """
+    backoff = min(RETRY_BASE_DELAY * 2 ** (attempts - 1), RETRY_MAX_DELAY)
+    return random_sleep_duration(backoff / 2, backoff * 1.5)
+
+
+def _get_retry_after(response: Optional[requests.Response]) -> float:
+    """
+    Get how many seconds Southwest asked to wait before retrying. The Retry-After header is either
+    a number of seconds or an HTTP date. Returns 0 if Southwest didn't say when to retry.
+    """
+    retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+    if retry_after.isdigit():
+        return int(retry_after)
+
+    try:
+        retry_time = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return 0
+
+    if retry_time.tzinfo is None:
+        # HTTP dates are always in UTC
+        retry_time = retry_time.replace(tzinfo=timezone.utc)
+
+    return max((retry_time - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+class RateLimiter:
+    """
+    Spaces out requests so they are sent at most once every min_interval seconds. A request is
+    only delayed if another request was sent less than min_interval seconds before it.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self.next_request_time = 0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            current_time = time.monotonic()
+            request_time = max(current_time, self.next_request_time)
+            self.next_request_time = request_time + self.min_interval
+
+        sleep_time = request_time - current_time
+        if sleep_time > 0:
+            logger.debug("Rate limiting request for %.2f seconds", sleep_time)
+            time.sleep(sleep_time)
+
+
 def get_current_time() -> datetime:
     """
     Fetch the current time from an NTP server. Times are sometimes off on computers running the
@@ -23,6 +23,9 @@ Options:
 
 For more information, check out https://github.com/jdholtz/auto-southwest-check-in#readme"""
 
+VERSION_FLAGS = {"--version", "-V"}
+HELP_FLAGS = {"--help", "-h"}
+
 
 def print_version() -> None:
     print("Auto-Southwest Check-In " + __version__)
@@ -35,10 +38,11 @@ def print_usage() -> None:
 
 def check_flags(arguments: List[str]) -> None:
     """Checks for version and help flags and exits the script on success"""
-    if "--version" in arguments or "-V" in arguments:
+    flags = set(arguments)
+    if not VERSION_FLAGS.isdisjoint(flags):
         print_version()
         sys.exit()
-    elif "--help" in arguments or "-h" in arguments:
+    elif not HELP_FLAGS.isdisjoint(flags):
         print_usage()
         sys.exit()
 
@@ -7,13 +7,14 @@ from typing import List
 from unittest import mock
 
 import pytest
+from pytest_mock import MockerFixture
 from requests_mock.mocker import Mocker as RequestMocker
 
 from lib.config import GlobalConfig
 from lib.fare_checker import BOOKING_URL, FareChecker
 from lib.flight import Flight
 from lib.reservation_monitor import ReservationMonitor
-from lib.utils import BASE_URL, CheckFaresOption, FlightChangeError
+from lib.utils import BASE_URL, CheckFaresOption, FlightChangeError, RateLimiter
 
 CHANGE_FLIGHT_URL = BASE_URL + BOOKING_URL + "change_page"
 MATCHING_FLIGHTS_URL = BASE_URL + BOOKING_URL + "matching_flights"
@@ -85,6 +86,12 @@ FLIGHT_CARDS = [
 MATCHING_FLIGHTS = {"changeShoppingPage": {"flights": {"outboundPage": {"cards": FLIGHT_CARDS}}}}
 
 
+@pytest.fixture(autouse=True)
+def no_rate_limit(mocker: MockerFixture) -> None:
+    # Spacing out the requests doesn't affect the results and slows the tests down
+    mocker.patch.object(RateLimiter, "wait")
+
+
 @pytest.fixture
 def monitor() -> ReservationMonitor:
     config = GlobalConfig()
@@ -3,7 +3,6 @@ Tests the ReservationMonitor and CheckInScheduler to ensure flights are correctl
 are set, errors are handled, and integration with the webdriver works.
 """
 
-import json
 from datetime import datetime
 from multiprocessing import Lock
 from unittest import mock
@@ -58,8 +57,7 @@ def test_flight_is_scheduled_checks_in_and_departs(
 ) -> None:
     tz_data = {"LAX": "America/Los_Angeles"}
 
-    mocker.patch("pathlib.Path.read_text", return_value=json.dumps(tz_data))
-    mocker.patch("lib.reservation_monitor.get_current_time", return_value=datetime(2020, 10, 5))
+    mocker.patch.dict("lib.flight.AIRPORT_TIMEZONES", tz_data)
     mock_process = mocker.patch("lib.checkin_handler.Process").return_value
     mock_new_flights_notification = mocker.patch(
         "lib.notification_handler.NotificationHandler.new_flights"
@@ -136,9 +134,8 @@ def test_account_schedules_new_flights(requests_mock: RequestMocker, mocker: Moc
     config.create_account_config([{"username": "test_user", "password": "test_pass"}])
 
     tz_data = {"LAX": "America/Los_Angeles", "SYD": "Australia/Sydney"}
-    mocker.patch("pathlib.Path.read_text", return_value=json.dumps(tz_data))
+    mocker.patch.dict("lib.flight.AIRPORT_TIMEZONES", tz_data)
 
-    mocker.patch("lib.reservation_monitor.get_current_time", return_value=datetime(2020, 10, 10))
     mocker.patch("lib.checkin_scheduler.get_current_time", return_value=datetime(2020, 10, 10))
     mocker.patch("lib.webdriver.seleniumbase_actions.wait_for_element_not_visible")
     mock_process = mocker.patch("lib.checkin_handler.Process").return_value
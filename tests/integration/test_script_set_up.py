@@ -93,9 +93,9 @@ def test_account_from_command_line_with_verbose(
     mocker.patch("multiprocessing.active_children", return_value=[mock_process])
 
     args = ["test_user", "test_pass", verbose_flag]
-    # sys.argv is used instead of the args passed in to the log module (it also would have
-    # southwest.py prepended to it in real use)
-    mocker.patch("sys.argv", ["test_file"] + args)
+    # The log module reads the verbose flag from sys.argv when it is imported, which already
+    # happened, so set the result directly
+    mocker.patch("lib.log.VERBOSE", True)
 
     main.main(args, "test_version")
 
@@ -27,7 +27,11 @@ class TestCheckInHandler:
         self.handler.pid = 0
 
     def test_schedule_check_in_starts_a_process(self, mocker: MockerFixture) -> None:
+        mock_wait_for_notifications = mocker.patch("lib.checkin_handler.wait_for_notifications")
         mock_process = mocker.patch("lib.checkin_handler.Process")
+        mock_process.return_value.start.side_effect = (
+            lambda: mock_wait_for_notifications.assert_called_once()
+        )
 
         self.handler.schedule_check_in()
 
@@ -62,7 +66,7 @@ class TestCheckInHandler:
         mock_os_waitpid.assert_called_once_with(self.handler.pid, 0)
 
     def test_set_check_in_correctly_sets_up_check_in_process(self, mocker: MockerFixture) -> None:
-        self.handler.flight.departure_time = datetime(1999, 12, 31, 18, 29)
+        self.handler.flight.checkin_time = datetime(1999, 12, 30, 18, 29)
         mock_wait_for_check_in = mocker.patch.object(CheckInHandler, "_wait_for_check_in")
         mock_check_in = mocker.patch.object(CheckInHandler, "_check_in")
 
@@ -147,6 +151,27 @@ class TestCheckInHandler:
         mock_sleep.assert_has_calls([mock.call(17400), mock.call(1800)])
         mock_timeout_before_checkin_notification.assert_called_once()
 
+    @pytest.mark.filterwarnings(
+        # Mocking multiprocessing.Lock causes this warning
+        "ignore:Mocks returned by pytest-mock do not need to be used as context managers:"
+    )
+    def test_wait_for_check_in_does_not_sleep_when_check_in_passes_while_refreshing_headers(
+        self, mocker: MockerFixture
+    ) -> None:
+        mock_sleep = mocker.patch("time.sleep")
+        mocker.patch.object(self.handler.checkin_scheduler, "refresh_headers")
+        mocker.patch(
+            "lib.checkin_handler.get_current_time",
+            side_effect=[
+                datetime(1999, 12, 31, 18, 29, 59),
+                datetime(1999, 12, 31, 23, 50, 59),
+            ],
+        )
+
+        self.handler._wait_for_check_in(datetime(1999, 12, 31, 23, 49, 59))
+
+        mock_sleep.assert_has_calls([mock.call(17400), mock.call(0)])
+
     @pytest.mark.parametrize(["weeks", "expected_sleep_calls"], [(0, 0), (1, 1), (3, 2)])
     def test_safe_sleep_sleeps_in_intervals(
         self, mocker: MockerFixture, weeks: int, expected_sleep_calls: int
@@ -245,6 +270,10 @@ class TestCheckInHandler:
             "checkInViewReservationPage": {"_links": {"checkIn": {"href": "", "body": ""}}}
         }
         post_response = {"checkInConfirmationPage": "Checked In!"}
-        mocker.patch("lib.checkin_handler.make_request", side_effect=[get_response, post_response])
+        mock_make_request = mocker.patch(
+            "lib.checkin_handler.make_request", side_effect=[get_response, post_response]
+        )
 
         assert self.handler._check_in_to_flight() == post_response
+        for make_request_call in mock_make_request.call_args_list:
+            assert make_request_call.kwargs["retry_client_errors"] is True
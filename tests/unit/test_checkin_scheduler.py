@@ -41,7 +41,7 @@ class TestCheckInScheduler:
 
     def test_process_reservations_handles_all_reservations(self, mocker: MockerFixture) -> None:
         mock_get_flights = mocker.patch.object(
-            CheckInScheduler, "_get_flights", return_value=["flight"]
+            CheckInScheduler, "_get_flights", side_effect=lambda number: [f"{number}_flight"]
         )
         mock_update_scheduled_flights = mocker.patch.object(
             CheckInScheduler, "_update_scheduled_flights"
@@ -49,8 +49,9 @@ class TestCheckInScheduler:
 
         self.scheduler.process_reservations(["test1", "test2"])
 
-        mock_get_flights.assert_has_calls([mock.call("test1"), mock.call("test2")])
-        mock_update_scheduled_flights.assert_called_once_with(["flight", "flight"])
+        # Reservations are retrieved concurrently, so they can be retrieved in any order
+        mock_get_flights.assert_has_calls([mock.call("test1"), mock.call("test2")], any_order=True)
+        mock_update_scheduled_flights.assert_called_once_with(["test1_flight", "test2_flight"])
 
     def test_refresh_headers_sets_new_headers(self, mocker: MockerFixture) -> None:
         mock_webdriver_set_headers = mocker.patch.object(WebDriver, "set_headers")
@@ -107,10 +108,13 @@ class TestCheckInScheduler:
 
     def test_get_reservation_info_returns_reservation_info(self, mocker: MockerFixture) -> None:
         reservation_content = {"viewReservationViewPage": {"bounds": [{"test": "reservation"}]}}
-        mocker.patch("lib.checkin_scheduler.make_request", return_value=reservation_content)
+        mock_make_request = mocker.patch(
+            "lib.checkin_scheduler.make_request", return_value=reservation_content
+        )
 
         reservation_info = self.scheduler._get_reservation_info("flight1")
         assert reservation_info == {"bounds": [{"test": "reservation"}]}
+        assert mock_make_request.call_args.kwargs["retry_client_errors"] is True
 
     def test_get_reservation_info_sends_error_notification_when_reservation_not_found(
         self, mocker: MockerFixture
@@ -230,14 +234,15 @@ class TestCheckInScheduler:
         mock_stop_check_in = mocker.patch.object(CheckInHandler, "stop_check_in")
         mocker.patch.object(Flight, "get_display_time")
 
-        self.scheduler.flights = test_flights
-        self.scheduler.checkin_handlers = [
+        checkin_handlers = [
             CheckInHandler(self.scheduler, test_flights[0], None),
             CheckInHandler(self.scheduler, test_flights[1], None),
         ]
+        self.scheduler.flights = test_flights
+        self.scheduler.checkin_handlers = checkin_handlers
 
         self.scheduler._remove_old_flights([test_flights[1]])
 
-        assert len(self.scheduler.flights) == 1
-        assert len(self.scheduler.checkin_handlers) == 1
+        assert self.scheduler.flights == [test_flights[1]]
+        assert self.scheduler.checkin_handlers == [checkin_handlers[1]]
         mock_stop_check_in.assert_called_once()
@@ -9,7 +9,7 @@ from lib.fare_checker import FareChecker
 from lib.flight import Flight
 from lib.notification_handler import NotificationHandler
 from lib.reservation_monitor import ReservationMonitor
-from lib.utils import CheckFaresOption, FlightChangeError
+from lib.utils import CheckFaresOption, FlightChangeError, RateLimiter
 
 # This needs to be accessed to be tested
 # pylint: disable=protected-access
@@ -37,6 +37,14 @@ class TestFareChecker:
         # pylint: disable-next=attribute-defined-outside-init
         self.checker = FareChecker(ReservationMonitor(ReservationConfig()))
 
+    def test_rate_limiter_is_shared_between_fare_checkers(self) -> None:
+        new_checker = FareChecker(ReservationMonitor(ReservationConfig()))
+        assert new_checker.rate_limiter is self.checker.rate_limiter
+
+    def test_headers_are_the_latest_headers_from_the_scheduler(self) -> None:
+        self.checker.reservation_monitor.checkin_scheduler.headers = {"new": "headers"}
+        assert self.checker.headers == {"new": "headers"}
+
     def test_check_flight_price_sends_notification_on_lower_fares(
         self, mocker: MockerFixture
     ) -> None:
@@ -79,9 +87,9 @@ class TestFareChecker:
         assert price == {"amount": -300, "currencyCode": "PTS"}
         mock_get_matching_fare.assert_called_once_with(["fare_one", "fare_two"], "test_fare")
 
-    @pytest.mark.parametrize("bound", ["outbound", "inbound"])
+    @pytest.mark.parametrize(["bound", "bound_idx"], [("outbound", 0), ("inbound", 1)])
     def test_get_matching_flights_retrieves_correct_bound_page(
-        self, mocker: MockerFixture, test_flight: Flight, bound: str
+        self, mocker: MockerFixture, test_flight: Flight, bound: str, bound_idx: int
     ) -> None:
         change_flight_page = {"_links": {"changeShopping": {"href": "test_link"}}}
         fare_type_bounds = [
@@ -96,7 +104,9 @@ class TestFareChecker:
 
         search_query = {"outbound": {"isChangeBound": False}}
         search_query.update({bound: {"isChangeBound": True}})
-        mocker.patch.object(FareChecker, "_get_search_query", return_value=search_query)
+        mocker.patch.object(
+            FareChecker, "_get_search_query", return_value=(search_query, bound_idx)
+        )
 
         response = {"changeShoppingPage": {"flights": {f"{bound}Page": {"cards": "test_cards"}}}}
         mocker.patch("lib.fare_checker.make_request", return_value=response)
@@ -106,30 +116,6 @@ class TestFareChecker:
         assert matching_flights == "test_cards"
         assert fare_type == bound + "_fare"
 
-    def test_get_change_flight_page_raises_exception_when_bound_not_matched(
-        self, mocker: MockerFixture, test_flight: Flight
-    ) -> None:
-        change_flight_page = {"_links": {"changeShopping": {"href": "test_link"}}}
-        fare_type_bounds = [
-            {"fareProductDetails": {"fareProductId": "outbound_fare"}},
-            {"fareProductDetails": {"fareProductId": "inbound_fare"}},
-        ]
-        mocker.patch.object(
-            FareChecker,
-            "_get_change_flight_page",
-            return_value=(change_flight_page, fare_type_bounds),
-        )
-
-        # Set both bounds to be false which could happen when the flight number doesn't match those
-        # on the reservation, indicating a formatting change on Southwest's end
-        search_query = {"outbound": {"isChangeBound": False}, "inbound": {"isChangeBound": False}}
-        mocker.patch.object(FareChecker, "_get_search_query", return_value=search_query)
-
-        mocker.patch("lib.fare_checker.make_request")
-
-        with pytest.raises(ValueError):
-            self.checker._get_matching_flights(test_flight)
-
     def test_get_change_flight_page_retrieves_change_flight_page(
         self, mocker: MockerFixture
     ) -> None:
@@ -137,11 +123,12 @@ class TestFareChecker:
             "bounds": ["bound_one", "bound_two"],
             "_links": {"change": {"href": "test_link", "query": "query_body"}},
         }
+        flight = mocker.Mock(reservation_info=res_info, confirmation_number="TEST")
         flight_page = {"changeFlightPage": "test_page"}
         mock_make_request = mocker.patch("lib.fare_checker.make_request", return_value=flight_page)
         mock_check_for_companion = mocker.patch.object(FareChecker, "_check_for_companion")
 
-        change_flight_page, fare_type_bounds = self.checker._get_change_flight_page(res_info)
+        change_flight_page, fare_type_bounds = self.checker._get_change_flight_page(flight)
 
         mock_check_for_companion.assert_called_once()
         assert change_flight_page == "test_page"
@@ -151,6 +138,67 @@ class TestFareChecker:
         assert call_args[1] == fare_checker.BOOKING_URL + "test_link"
         assert call_args[3] == "query_body"
 
+    def test_get_change_flight_page_uses_cached_page_for_the_same_reservation(
+        self, mocker: MockerFixture
+    ) -> None:
+        res_info = {
+            "bounds": ["bound_one", "bound_two"],
+            "_links": {"change": {"href": "test_link", "query": "query_body"}},
+        }
+        flight = mocker.Mock(reservation_info=res_info, confirmation_number="TEST")
+        flight_page = {"changeFlightPage": "test_page"}
+        mock_make_request = mocker.patch("lib.fare_checker.make_request", return_value=flight_page)
+        mocker.patch.object(FareChecker, "_check_for_companion")
+
+        self.checker._get_change_flight_page(flight)
+        change_flight_page, fare_type_bounds = self.checker._get_change_flight_page(flight)
+
+        mock_make_request.assert_called_once()
+        assert change_flight_page == "test_page"
+        assert fare_type_bounds == ["bound_one", "bound_two"]
+
+    def test_get_change_flight_page_does_not_use_cached_page_for_other_reservations(
+        self, mocker: MockerFixture
+    ) -> None:
+        res_info = {
+            "bounds": ["bound_one", "bound_two"],
+            "_links": {"change": {"href": "test_link", "query": "query_body"}},
+        }
+        flight_page = {"changeFlightPage": "test_page"}
+        mock_make_request = mocker.patch("lib.fare_checker.make_request", return_value=flight_page)
+        mocker.patch.object(FareChecker, "_check_for_companion")
+        mocker.patch.object(RateLimiter, "wait")
+
+        self.checker._get_change_flight_page(
+            mocker.Mock(reservation_info=res_info, confirmation_number="TEST1")
+        )
+        self.checker._get_change_flight_page(
+            mocker.Mock(reservation_info=res_info, confirmation_number="TEST2")
+        )
+
+        assert mock_make_request.call_count == 2
+
+    def test_get_change_flight_page_requests_page_again_when_cache_expires(
+        self, mocker: MockerFixture
+    ) -> None:
+        res_info = {
+            "bounds": ["bound_one", "bound_two"],
+            "_links": {"change": {"href": "test_link", "query": "query_body"}},
+        }
+        flight = mocker.Mock(reservation_info=res_info, confirmation_number="TEST")
+        flight_page = {"changeFlightPage": "test_page"}
+        mock_make_request = mocker.patch("lib.fare_checker.make_request", return_value=flight_page)
+        mocker.patch.object(FareChecker, "_check_for_companion")
+        mocker.patch.object(RateLimiter, "wait")
+        mocker.patch(
+            "time.monotonic", side_effect=[0, fare_checker.CHANGE_FLIGHT_PAGE_CACHE_SECONDS, 0]
+        )
+
+        self.checker._get_change_flight_page(flight)
+        self.checker._get_change_flight_page(flight)
+
+        assert mock_make_request.call_count == 2
+
     def test_get_change_flight_page_raises_exception_when_flight_cannot_be_changed(
         self, mocker: MockerFixture
     ) -> None:
@@ -159,9 +207,10 @@ class TestFareChecker:
             "bounds": ["bound_one", "bound_two"],
             "_links": {"change": None},
         }
+        flight = mocker.Mock(reservation_info=reservation_info, confirmation_number="TEST")
 
         with pytest.raises(FlightChangeError):
-            self.checker._get_change_flight_page(reservation_info)
+            self.checker._get_change_flight_page(flight)
 
     def test_get_search_query_returns_the_correct_query_for_one_way(
         self, test_flight: Flight
@@ -177,8 +226,9 @@ class TestFareChecker:
             "_links": {"changeShopping": {"body": [{"boundReference": "bound_1"}]}},
         }
 
-        search_query = self.checker._get_search_query(flight_page, test_flight)
+        search_query, bound = self.checker._get_search_query(flight_page, test_flight)
 
+        assert bound == 0
         assert len(search_query) == 1
         assert search_query.get("outbound") == {
             "boundReference": "bound_1",
@@ -212,8 +262,9 @@ class TestFareChecker:
             },
         }
 
-        search_query = self.checker._get_search_query(flight_page, test_flight)
+        search_query, bound = self.checker._get_search_query(flight_page, test_flight)
 
+        assert bound == 1
         assert len(search_query) == 2
         assert search_query.get("outbound") == {
             "boundReference": "bound_1",
@@ -230,6 +281,25 @@ class TestFareChecker:
             "isChangeBound": True,
         }
 
+    def test_get_search_query_raises_exception_when_bound_not_matched(
+        self, test_flight: Flight
+    ) -> None:
+        # The flight number doesn't match those on the reservation, which indicates a formatting
+        # change on Southwest's end
+        bound_one = {
+            "originalDate": "1/1",
+            "toAirportCode": "LAX",
+            "fromAirportCode": "MIA",
+            "flight": "99",
+        }
+        flight_page = {
+            "boundSelections": [bound_one],
+            "_links": {"changeShopping": {"body": [{"boundReference": "bound_1"}]}},
+        }
+
+        with pytest.raises(ValueError):
+            self.checker._get_search_query(flight_page, test_flight)
+
     def test_check_for_companion_raises_exception_when_a_companion_is_detected(self) -> None:
         reservation_info = {
             "greyBoxMessage": {
@@ -287,6 +357,30 @@ class TestFareChecker:
 
         assert self.checker._get_lowest_fare(test_flight, flights, "test_fare") == fares[0]
 
+    def test_get_lowest_fare_stops_after_matching_same_flight(
+        self, mocker: MockerFixture, test_flight: Flight
+    ) -> None:
+        mock_filter = mocker.patch("lib.fare_checker.same_flight_filter", return_value=True)
+        self.checker.filter = mock_filter
+
+        flights = [{"fares": "fare1"}, {"fares": "fare2"}]
+        fare = {"amount": 3000, "currencyCode": "PTS"}
+        mocker.patch.object(FareChecker, "_get_matching_fare", return_value=fare)
+
+        assert self.checker._get_lowest_fare(test_flight, flights, "test_fare") == fare
+        mock_filter.assert_called_once()
+
+    def test_get_lowest_fare_skips_flights_without_a_matching_fare(
+        self, mocker: MockerFixture, test_flight: Flight
+    ) -> None:
+        self.checker.filter = fare_checker.any_flight_filter
+
+        flights = [{"fares": "fare1"}, {"fares": "fare2"}, {"fares": "fare3"}]
+        fares = [None, {"amount": 3000, "currencyCode": "PTS"}, None]
+        mocker.patch.object(FareChecker, "_get_matching_fare", side_effect=fares)
+
+        assert self.checker._get_lowest_fare(test_flight, flights, "test_fare") == fares[1]
+
     # An empty list of flights should never be returned from Southwest, but test just in case
     @pytest.mark.parametrize("flights", [[], [{"fares": "fare1"}]])
     def test_get_lowest_fare_returns_zero_when_no_matching_fares(
@@ -300,7 +394,8 @@ class TestFareChecker:
             "currencyCode": "USD",
         }
 
-    def test_get_matching_fare_returns_the_correct_fare(self) -> None:
+    @pytest.mark.parametrize(["sign", "amount"], [({"sign": "-"}, -3000), ({}, 3000)])
+    def test_get_matching_fare_returns_the_correct_fare(self, sign: JSON, amount: int) -> None:
         fares = [
             {
                 "_meta": {"fareProductId": "wrong_fare"},
@@ -308,11 +403,11 @@ class TestFareChecker:
             },
             {
                 "_meta": {"fareProductId": "right_fare"},
-                "priceDifference": {"amount": "3,000", "sign": "-", "currencyCode": "PTS"},
+                "priceDifference": {"amount": "3,000", "currencyCode": "PTS", **sign},
             },
         ]
         fare_price = self.checker._get_matching_fare(fares, "right_fare")
-        assert fare_price == {"amount": -3000, "currencyCode": "PTS"}
+        assert fare_price == {"amount": amount, "currencyCode": "PTS"}
 
     @pytest.mark.parametrize("fares", [None, [], [{"_meta": {"fareProductId": "right_fare"}}]])
     def test_get_matching_fare_returns_nothing_when_price_is_not_available(
@@ -1,12 +1,12 @@
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Dict, List
 from unittest import mock
+from zoneinfo import ZoneInfo
 
 import pytest
-import pytz
 from pytest_mock import MockerFixture
 
+from lib import flight
 from lib.flight import Flight
 
 # This needs to be accessed to be tested
@@ -67,6 +67,7 @@ class TestFlight:
         flight2.departure_time = datetime(1999, 1, 1, 8, 59)
 
         assert flight1 == flight2
+        assert hash(flight1) == hash(flight2)
 
     @pytest.mark.parametrize(
         ["flight_info", "departure_time"],
@@ -106,15 +107,17 @@ class TestFlight:
     def test_get_display_time_formats_time_correctly(
         self, twenty_four_hr: bool, expected_time: str
     ) -> None:
-        tz = pytz.timezone("Asia/Calcutta")
-        self.flight._local_departure_time = tz.localize(datetime(1999, 12, 31, 13, 59))
+        tz = ZoneInfo("Asia/Calcutta")
+        self.flight._local_departure_time = datetime(1999, 12, 31, 13, 59, tzinfo=tz)
         assert self.flight.get_display_time(twenty_four_hr) == f"1999-12-31 {expected_time} IST"
 
     def test_set_flight_time_sets_the_correct_time(self, mocker: MockerFixture) -> None:
         mock_get_airport_tz = mocker.patch.object(
             Flight, "_get_airport_timezone", return_value="Asia/Calcutta"
         )
-        mock_convert_to_utc = mocker.patch.object(Flight, "_convert_to_utc", return_value="18:29")
+        mock_convert_to_utc = mocker.patch.object(
+            Flight, "_convert_to_utc", return_value=datetime(1999, 12, 31, 18, 29)
+        )
 
         flight_info = {
             "departureDate": "12-31-99",
@@ -124,21 +127,49 @@ class TestFlight:
         self.flight._set_flight_time(flight_info)
 
         mock_get_airport_tz.assert_called_once_with("999")
-        mock_convert_to_utc.assert_called_once_with("12-31-99 23:59", "Asia/Calcutta")
-        assert self.flight.departure_time == "18:29"
+        mock_convert_to_utc.assert_called_once_with("12-31-99", "23:59", "Asia/Calcutta")
+        assert self.flight.departure_time == datetime(1999, 12, 31, 18, 29)
+        assert self.flight.checkin_time == datetime(1999, 12, 30, 18, 29)
+
+    def test_checkin_time_follows_the_departure_time(self) -> None:
+        self.flight.departure_time = datetime(1999, 12, 31, 18, 29)
+        assert self.flight.checkin_time == datetime(1999, 12, 30, 18, 29)
+
+        self.flight.departure_time = datetime(2000, 1, 5, 12, 0)
+        assert self.flight.checkin_time == datetime(2000, 1, 4, 12, 0)
 
     def test_get_airport_timezone_returns_the_correct_timezone(self, mocker: MockerFixture) -> None:
-        mocker.patch.object(Path, "read_text")
-        mocker.patch("json.loads", return_value={"test_code": "Asia/Calcutta"})
+        mocker.patch.dict("lib.flight.AIRPORT_TIMEZONES", {"test_code": "Asia/Calcutta"})
         timezone = self.flight._get_airport_timezone("test_code")
-        assert timezone == pytz.timezone("Asia/Calcutta")
+        assert timezone == ZoneInfo("Asia/Calcutta")
 
     def test_convert_to_utc_converts_local_time_to_utc(self) -> None:
-        tz = pytz.timezone("Asia/Calcutta")
-        utc_flight_time = self.flight._convert_to_utc("1999-12-31 23:59", tz)
+        tz = ZoneInfo("Asia/Calcutta")
+        utc_flight_time = self.flight._convert_to_utc("1999-12-31", "23:59", tz)
 
         assert utc_flight_time == datetime(1999, 12, 31, 18, 29)
-        assert self.flight._local_departure_time == tz.localize(datetime(1999, 12, 31, 23, 59))
+        assert self.flight._local_departure_time == datetime(1999, 12, 31, 23, 59, tzinfo=tz)
+
+    def test_convert_to_utc_uses_standard_time_for_ambiguous_times(self) -> None:
+        tz = ZoneInfo("America/Chicago")
+        # 1:30 AM happens twice on this day, first in CDT and then in CST
+        utc_flight_time = self.flight._convert_to_utc("2024-11-03", "01:30", tz)
+
+        assert utc_flight_time == datetime(2024, 11, 3, 7, 30)
+
+    def test_convert_to_utc_caches_conversions(self) -> None:
+        tz = ZoneInfo("America/Chicago")
+        flight.convert_to_utc.cache_clear()
+
+        first_times = flight.convert_to_utc("1999-12-31", "23:59", tz)
+        second_times = flight.convert_to_utc("1999-12-31", "23:59", tz)
+
+        assert first_times == (
+            datetime(1999, 12, 31, 23, 59, tzinfo=tz),
+            datetime(2000, 1, 1, 5, 59),
+        )
+        assert second_times is first_times
+        assert flight.convert_to_utc.cache_info().hits == 1
 
     @pytest.mark.parametrize(
         ["numbers", "expected_num"],
@@ -1,6 +1,4 @@
 import logging
-import multiprocessing
-import sys
 from typing import Iterator
 
 import pytest
@@ -27,20 +25,15 @@ def test_init_main_logging_initializes_the_logging_correctly(logger: logging.Log
 
 
 @pytest.mark.parametrize(
-    ["argument", "verbosity_level"],
-    [
-        ("", logging.INFO),
-        ("-v", logging.DEBUG),
-        ("--verbose", logging.DEBUG),
-    ],
+    ["verbose", "verbosity_level"], [(False, logging.INFO), (True, logging.DEBUG)]
 )
 def test_init_logging_sets_verbosity_level_correctly(
-    mocker: MockerFixture, argument: str, verbosity_level: int, logger: logging.Logger
+    mocker: MockerFixture, verbose: bool, verbosity_level: int, logger: logging.Logger
 ) -> None:
     mocker.patch("logging.handlers.RotatingFileHandler")
     mock_makedirs = mocker.patch("os.makedirs")
 
-    sys.argv = ["", argument]
+    mocker.patch("lib.log.VERBOSE", verbose)
     log.init_logging(logger)
 
     mock_makedirs.assert_called_once()
@@ -48,29 +41,28 @@ def test_init_logging_sets_verbosity_level_correctly(
     assert logger.handlers[1].level == verbosity_level
 
 
-def test_get_logger_does_not_initialize_logger_with_fork_start_method(
-    mocker: MockerFixture,
-) -> None:
-    mocker.patch("multiprocessing.get_start_method", return_value="fork")
+def test_get_logger_does_not_initialize_logger_when_not_needed(mocker: MockerFixture) -> None:
+    mocker.patch("lib.log.NEEDS_LOGGING_INIT", False)
     mock_init_logging = mocker.patch("lib.log.init_logging")
 
-    multiprocessing.current_process().name = "Process-1"
     log.get_logger("lib")
     mock_init_logging.assert_not_called()
 
 
-def test_get_logger_does_not_initialize_logger_in_main_process(mocker: MockerFixture) -> None:
+def test_get_logger_initializes_logger_when_needed(mocker: MockerFixture) -> None:
+    mocker.patch("lib.log.NEEDS_LOGGING_INIT", True)
     mock_init_logging = mocker.patch("lib.log.init_logging")
 
-    multiprocessing.current_process().name = "MainProcess"
     log.get_logger("lib")
-    mock_init_logging.assert_not_called()
+    mock_init_logging.assert_called_once()
 
 
-def test_get_logger_initializes_logger_with_spawn_start_method(mocker: MockerFixture) -> None:
-    mocker.patch("multiprocessing.get_start_method", return_value="spawn")
+def test_get_logger_does_not_initialize_logger_twice(
+    mocker: MockerFixture, logger: logging.Logger
+) -> None:
+    mocker.patch("lib.log.NEEDS_LOGGING_INIT", True)
     mock_init_logging = mocker.patch("lib.log.init_logging")
 
-    multiprocessing.current_process().name = "Process-1"
+    logger.handlers = [logging.StreamHandler()]
     log.get_logger("lib")
-    mock_init_logging.assert_called_once()
+    mock_init_logging.assert_not_called()
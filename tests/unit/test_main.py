@@ -28,6 +28,8 @@ def test_get_notification_urls_gets_all_urls() -> None:
 
     # Sort because order is not important
     assert sorted(notification_urls) == ["url1", "url2", "url3"]
+    # The global config's URLs should not be modified
+    assert config.notification_urls == ["url1"]
 
 
 def test_test_notifications_sends_to_every_url_in_config(mocker: MockerFixture) -> None:
@@ -61,6 +63,18 @@ def test_set_up_reservations_starts_all_reservations(mocker: MockerFixture) -> N
     assert mock_reservation_start.call_count == len(config.reservations)
 
 
+@pytest.mark.parametrize(["notification_urls", "imports"], [(["url1"], 1), ([], 0)])
+def test_preload_apprise_imports_apprise_only_when_notifications_are_configured(
+    mocker: MockerFixture, notification_urls: List[str], imports: int
+) -> None:
+    mock_import_module = mocker.patch("importlib.import_module")
+    config = GlobalConfig()
+    config.notification_urls = notification_urls
+
+    main.preload_apprise(config)
+    assert mock_import_module.call_count == imports
+
+
 def test_set_up_check_in_sends_test_notifications_when_flag_passed(mocker: MockerFixture) -> None:
     mock_test_notifications = mocker.patch("lib.main.test_notifications")
     with pytest.raises(SystemExit):
@@ -83,11 +97,13 @@ def test_set_up_check_in_sets_up_account_and_reservation_with_arguments(
     mock_processes = [mock_process] * (accounts_len + reservations_len)
     mocker.patch("multiprocessing.active_children", return_value=mock_processes)
 
+    mock_preload_apprise = mocker.patch("lib.main.preload_apprise")
     mock_set_up_accounts = mocker.patch("lib.main.set_up_accounts")
     mock_set_up_reservations = mocker.patch("lib.main.set_up_reservations")
 
     main.set_up_check_in(arguments)
 
+    mock_preload_apprise.assert_called_once()
     assert len(mock_set_up_accounts.call_args[0][0].accounts) == accounts_len
     assert len(mock_set_up_reservations.call_args[0][0].reservations) == reservations_len
     assert mock_process.join.call_count == len(mock_processes)
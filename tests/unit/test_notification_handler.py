@@ -1,7 +1,9 @@
 import apprise
 import pytest
+import requests
 from pytest_mock import MockerFixture
 
+from lib import notification_handler
 from lib.notification_handler import NotificationHandler
 from lib.utils import NotificationLevel
 
@@ -16,6 +18,10 @@ class TestNotificationHandler:
         # pylint: disable-next=attribute-defined-outside-init
         self.handler = NotificationHandler(mock_reservation_monitor)
 
+        # Send notifications right away instead of in the background
+        mock_executor = mocker.patch("lib.notification_handler.EXECUTOR")
+        mock_executor.submit.side_effect = lambda func, *args, **kwargs: func(*args, **kwargs)
+
     def test_send_nofication_does_not_send_notifications_if_level_is_too_low(
         self, mocker: MockerFixture
     ) -> None:
@@ -36,6 +42,24 @@ class TestNotificationHandler:
         self.handler.send_notification("test notification", level)
         assert mock_apprise_notify.call_args[1]["body"] == "test notification"
 
+    def test_send_notification_only_prints_when_no_urls_are_configured(
+        self, mocker: MockerFixture
+    ) -> None:
+        mock_apprise = mocker.patch("apprise.Apprise")
+        self.handler.notification_urls = []
+
+        self.handler.send_notification("test notification")
+        mock_apprise.assert_not_called()
+
+    def test_send_notification_reuses_the_apprise_object(self, mocker: MockerFixture) -> None:
+        mock_apprise = mocker.patch("apprise.Apprise")
+
+        self.handler.send_notification("test notification")
+        self.handler.send_notification("test notification")
+
+        mock_apprise.assert_called_once_with(self.handler.notification_urls)
+        assert mock_apprise.return_value.notify.call_count == 2
+
     def test_new_flights_sends_no_notification_if_no_flights_exist(
         self, mocker: MockerFixture
     ) -> None:
@@ -165,7 +189,7 @@ class TestNotificationHandler:
     def test_healthchecks_success_pings_url_only_if_configured(
         self, mocker: MockerFixture, url: str, expected_calls: int
     ) -> None:
-        mock_post = mocker.patch("requests.post")
+        mock_post = mocker.patch("lib.utils.SESSION.post")
         self.handler.reservation_monitor.config.healthchecks_url = url
 
         self.handler.healthchecks_success("healthchecks success")
@@ -175,12 +199,20 @@ class TestNotificationHandler:
     def test_healthchecks_fail_pings_url_only_if_configured(
         self, mocker: MockerFixture, url: str, expected_calls: int
     ) -> None:
-        mock_post = mocker.patch("requests.post")
+        mock_post = mocker.patch("lib.utils.SESSION.post")
         self.handler.reservation_monitor.config.healthchecks_url = url
 
         self.handler.healthchecks_fail("healthchecks fail")
         assert mock_post.call_count == expected_calls
 
+    def test_ping_healthchecks_logs_request_errors(self, mocker: MockerFixture) -> None:
+        mock_post = mocker.patch("lib.utils.SESSION.post", side_effect=requests.ConnectionError)
+        mock_logger = mocker.patch("lib.notification_handler.logger")
+
+        self.handler._ping_healthchecks("http://healthchecks", "healthchecks success")
+        mock_post.assert_called_once()
+        mock_logger.error.assert_called_once()
+
     def test_get_account_name_returns_username_when_no_name_is_set(
         self, mocker: MockerFixture
     ) -> None:
@@ -189,8 +221,27 @@ class TestNotificationHandler:
         self.handler.reservation_monitor.last_name = None
         self.handler.reservation_monitor.username = "Test user"
         assert self.handler._get_account_name() == self.handler.reservation_monitor.username
+        # The username is only used until the account's name is known, so it isn't cached
+        assert self.handler.account_name is None
 
     def test_get_account_name_returns_the_correct_name_when_set(self) -> None:
         self.handler.reservation_monitor.first_name = "John"
         self.handler.reservation_monitor.last_name = "Doe"
         assert self.handler._get_account_name() == "John Doe"
+        assert self.handler.account_name == "John Doe"
+
+    def test_get_account_name_uses_the_cached_name(self) -> None:
+        self.handler.account_name = "Jane Doe"
+        self.handler.reservation_monitor.first_name = "John"
+        assert self.handler._get_account_name() == "Jane Doe"
+
+
+def test_wait_for_notifications_stops_the_executor_and_creates_a_new_one(
+    mocker: MockerFixture,
+) -> None:
+    mock_executor = mocker.patch("lib.notification_handler.EXECUTOR")
+
+    notification_handler.wait_for_notifications()
+
+    mock_executor.shutdown.assert_called_once()
+    assert notification_handler.EXECUTOR is not mock_executor
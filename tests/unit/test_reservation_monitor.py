@@ -1,5 +1,4 @@
 import multiprocessing
-from datetime import datetime
 from unittest import mock
 
 import pytest
@@ -35,12 +34,18 @@ def mock_lock(mocker: MockerFixture) -> None:
 )
 class TestReservationMonitor:
     @pytest.fixture(autouse=True)
-    def _set_up_monitor(self, mock_lock: mock.Mock, mocker: MockerFixture) -> None:
+    def _set_up_monitor(self, mock_lock: mock.Mock) -> None:
         # pylint: disable-next=attribute-defined-outside-init
         self.monitor = ReservationMonitor(ReservationConfig(), mock_lock)
-        mocker.patch(
-            "lib.reservation_monitor.get_current_time", return_value=datetime(1999, 12, 31)
-        )
+
+    def test_checkin_scheduler_is_only_created_once_accessed(self, mocker: MockerFixture) -> None:
+        mock_checkin_scheduler = mocker.patch("lib.reservation_monitor.CheckInScheduler")
+        monitor = ReservationMonitor(ReservationConfig())
+        mock_checkin_scheduler.assert_not_called()
+
+        assert monitor.checkin_scheduler == mock_checkin_scheduler.return_value
+        assert monitor.checkin_scheduler == mock_checkin_scheduler.return_value
+        mock_checkin_scheduler.assert_called_once_with(monitor)
 
     def test_start_starts_a_process(self, mocker: MockerFixture) -> None:
         mock_process_start = mocker.patch.object(multiprocessing.Process, "start")
@@ -94,6 +99,34 @@ class TestReservationMonitor:
         mock_check.assert_called_once()
         mock_smart_sleep.assert_not_called()
 
+    def test_monitor_skips_check_when_lock_is_not_acquired(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(ReservationMonitor, "_smart_sleep", side_effect=["", "", StopIteration])
+        mock_acquire_lock = mocker.patch.object(
+            ReservationMonitor, "_acquire_lock", side_effect=[True, False, True]
+        )
+        mock_check = mocker.patch.object(ReservationMonitor, "_check", return_value=False)
+
+        self.monitor.config.retrieval_interval = 1
+        with pytest.raises(StopIteration):
+            self.monitor._monitor()
+
+        assert mock_check.call_count == 2
+        assert self.monitor.lock.release.call_count == 2
+        mock_acquire_lock.assert_has_calls([mock.call(True), mock.call(False), mock.call(False)])
+
+    def test_acquire_lock_waits_for_the_lock_on_the_first_check(self) -> None:
+        self.monitor.lock.acquire.return_value = True
+
+        assert self.monitor._acquire_lock(True) is True
+        self.monitor.lock.acquire.assert_called_once_with(timeout=None)
+
+    def test_acquire_lock_times_out_after_the_first_check(self) -> None:
+        self.monitor.lock.acquire.return_value = False
+        self.monitor.config.retrieval_interval = 100
+
+        assert self.monitor._acquire_lock(False) is False
+        self.monitor.lock.acquire.assert_called_once_with(timeout=10)
+
     def test_check_checks_reservations(self, mocker: MockerFixture) -> None:
         mock_refresh_headers = mocker.patch.object(CheckInScheduler, "refresh_headers")
         mock_schedule_reservations = mocker.patch.object(
@@ -154,6 +187,20 @@ class TestReservationMonitor:
 
         mock_process_reservations.assert_called_once_with(["Test1", "Test2"])
 
+    def test_schedule_reservations_only_schedules_each_reservation_once(
+        self, mocker: MockerFixture
+    ) -> None:
+        mock_process_reservations = mocker.patch.object(CheckInScheduler, "process_reservations")
+        reservations = [
+            {"confirmationNumber": "Test1"},
+            {"confirmationNumber": "Test2"},
+            {"confirmationNumber": "Test1"},
+        ]
+
+        self.monitor._schedule_reservations(reservations)
+
+        mock_process_reservations.assert_called_once_with(["Test1", "Test2"])
+
     def test_check_flight_fares_does_not_check_fares_if_configuration_is_false(
         self, mocker: MockerFixture
     ) -> None:
@@ -174,6 +221,34 @@ class TestReservationMonitor:
 
         assert mock_check_flight_price.call_count == len(self.monitor.checkin_scheduler.flights)
 
+    def test_check_flight_fares_reuses_fare_checker(self, mocker: MockerFixture) -> None:
+        mock_fare_checker = mocker.patch("lib.reservation_monitor.FareChecker")
+
+        self.monitor.config.check_fares = CheckFaresOption.SAME_FLIGHT
+        self.monitor._check_flight_fares()
+        self.monitor._check_flight_fares()
+
+        mock_fare_checker.assert_called_once_with(self.monitor)
+        assert self.monitor.fare_checker == mock_fare_checker.return_value
+        mock_fare_checker.return_value.change_flight_pages.clear.assert_called_once()
+
+    def test_check_flight_fares_checks_flights_on_the_same_reservation_together(
+        self, mocker: MockerFixture
+    ) -> None:
+        flight_one = mocker.Mock(confirmation_number="TEST1")
+        flight_two = mocker.Mock(confirmation_number="TEST2")
+        flight_three = mocker.Mock(confirmation_number="TEST1")
+        mock_check_reservation_fares = mocker.patch.object(
+            ReservationMonitor, "_check_reservation_fares"
+        )
+
+        self.monitor.config.check_fares = CheckFaresOption.SAME_FLIGHT
+        self.monitor.checkin_scheduler.flights = [flight_one, flight_two, flight_three]
+        self.monitor._check_flight_fares()
+
+        checked_flights = [call[0][0] for call in mock_check_reservation_fares.call_args_list]
+        assert checked_flights == [[flight_one, flight_three], [flight_two]]
+
     @pytest.mark.parametrize("exception", [RequestError(""), FlightChangeError, Exception])
     def test_check_flight_fares_catches_error_when_checking_fares(
         self, mocker: MockerFixture, exception: Exception
@@ -191,15 +266,24 @@ class TestReservationMonitor:
 
     def test_smart_sleep_sleeps_for_correct_time(self, mocker: MockerFixture) -> None:
         mock_sleep = mocker.patch("time.sleep")
-        mocker.patch(
-            "lib.reservation_monitor.get_current_time", return_value=datetime(1999, 12, 31)
-        )
+        mocker.patch("time.monotonic", return_value=36 * 60 * 60)
 
         self.monitor.config.retrieval_interval = 24 * 60 * 60
-        self.monitor._smart_sleep(datetime(1999, 12, 30, 12))
+        self.monitor._smart_sleep(24 * 60 * 60)
 
         mock_sleep.assert_called_once_with(12 * 60 * 60)
 
+    def test_smart_sleep_does_not_sleep_when_checks_take_longer_than_interval(
+        self, mocker: MockerFixture
+    ) -> None:
+        mock_sleep = mocker.patch("time.sleep")
+        mocker.patch("time.monotonic", return_value=36 * 60 * 60)
+
+        self.monitor.config.retrieval_interval = 60 * 60
+        self.monitor._smart_sleep(24 * 60 * 60)
+
+        mock_sleep.assert_called_once_with(0)
+
     def test_stop_checkins_stops_all_checkins(self, mocker: MockerFixture) -> None:
         mock_checkin_handler = mocker.patch.object(CheckInHandler, "stop_check_in")
 
@@ -220,12 +304,9 @@ class TestReservationMonitor:
 )
 class TestAccountMonitor:
     @pytest.fixture(autouse=True)
-    def _set_up_monitor(self, mock_lock: mock.Mock, mocker: MockerFixture) -> None:
+    def _set_up_monitor(self, mock_lock: mock.Mock) -> None:
         # pylint: disable-next=attribute-defined-outside-init
         self.monitor = AccountMonitor(AccountConfig(), mock_lock)
-        mocker.patch(
-            "lib.reservation_monitor.get_current_time", return_value=datetime(1999, 12, 31)
-        )
 
     def test_check_checks_account_for_reservations(self, mocker: MockerFixture) -> None:
         mocker.patch.object(AccountMonitor, "_get_reservations", return_value=([], False))
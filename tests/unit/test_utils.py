@@ -1,11 +1,13 @@
+import http.client
 import json
 import socket
 from datetime import datetime, timezone
-from typing import Any, Union
+from typing import Any, Dict, Union
 from unittest.mock import call
 
 import ntplib
 import pytest
+import requests
 from pytest_mock import MockerFixture
 from requests_mock.mocker import Mocker as RequestMocker
 
@@ -44,7 +46,7 @@ def test_make_request_raises_exception_on_failure(
 ) -> None:
     mock_sleep = mocker.patch("time.sleep")
     mocker.patch("lib.utils.random_sleep_duration", side_effect=[1.5, 1, 2.2, 3, 2])
-    requests_mock.post(utils.BASE_URL + "test", status_code=400, reason="error")
+    requests_mock.post(utils.BASE_URL + "test", status_code=500, reason="error")
 
     with pytest.raises(RequestError):
         utils.make_request("POST", "test", {}, {}, max_attempts=5)
@@ -55,6 +57,128 @@ def test_make_request_raises_exception_on_failure(
     mock_sleep.assert_has_calls(expected_calls)
 
 
+def test_make_request_backs_off_exponentially_between_attempts(
+    requests_mock: RequestMocker, mocker: MockerFixture
+) -> None:
+    mocker.patch("time.sleep")
+    mock_sleep_duration = mocker.patch("lib.utils.random_sleep_duration", return_value=1)
+    requests_mock.post(utils.BASE_URL + "test", status_code=500, reason="error")
+
+    with pytest.raises(RequestError):
+        utils.make_request("POST", "test", {}, {}, max_attempts=5)
+
+    # The backoff is capped at RETRY_MAX_DELAY
+    expected_calls = [call(1, 3), call(2, 6), call(4, 12), call(4, 12), call(4, 12)]
+    mock_sleep_duration.assert_has_calls(expected_calls)
+
+
+def test_make_request_waits_for_retry_after_header(
+    requests_mock: RequestMocker, mocker: MockerFixture
+) -> None:
+    mock_sleep = mocker.patch("time.sleep")
+    mocker.patch("lib.utils.random_sleep_duration", return_value=1)
+    requests_mock.post(
+        utils.BASE_URL + "test", status_code=429, reason="error", headers={"Retry-After": "20"}
+    )
+
+    with pytest.raises(RequestError):
+        utils.make_request("POST", "test", {}, {}, max_attempts=1)
+
+    mock_sleep.assert_called_once_with(20)
+
+
+def test_make_request_gives_up_when_retry_after_is_too_long(
+    requests_mock: RequestMocker, mocker: MockerFixture
+) -> None:
+    mock_sleep = mocker.patch("time.sleep")
+    mock_post = requests_mock.post(
+        utils.BASE_URL + "test", status_code=429, reason="error", headers={"Retry-After": "120"}
+    )
+
+    with pytest.raises(RequestError):
+        utils.make_request("POST", "test", {}, {})
+
+    assert mock_post.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ["headers", "expected_retry_after"],
+    [
+        ({}, 0),
+        ({"Retry-After": "15"}, 15),
+        ({"Retry-After": "Thu, 01 Jan 1970 00:00:20 GMT"}, 10),
+        ({"Retry-After": "Thu, 01 Jan 1970 00:00:20 -0000"}, 10),
+        ({"Retry-After": "Thu, 01 Jan 1970 00:00:05 GMT"}, 0),
+        ({"Retry-After": "invalid"}, 0),
+    ],
+)
+def test_get_retry_after_parses_seconds_and_http_dates(
+    mocker: MockerFixture, headers: Dict[str, str], expected_retry_after: int
+) -> None:
+    mock_datetime = mocker.patch("lib.utils.datetime")
+    mock_datetime.now.return_value = datetime(1970, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+    response = requests.Response()
+    response.headers.update(headers)
+
+    assert utils._get_retry_after(response) == expected_retry_after
+
+
+def test_get_retry_after_returns_zero_without_a_response() -> None:
+    assert utils._get_retry_after(None) == 0
+
+
+def test_make_request_does_not_retry_client_errors(
+    requests_mock: RequestMocker, mocker: MockerFixture
+) -> None:
+    mock_sleep = mocker.patch("time.sleep")
+    mock_get = requests_mock.get(utils.BASE_URL + "test", status_code=403, reason="Forbidden")
+
+    with pytest.raises(RequestError):
+        utils.make_request("GET", "test", {}, {})
+
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_make_request_retries_client_errors_when_requested(
+    requests_mock: RequestMocker, mocker: MockerFixture
+) -> None:
+    mocker.patch("time.sleep")
+    mock_get = requests_mock.get(utils.BASE_URL + "test", status_code=403, reason="Forbidden")
+
+    with pytest.raises(RequestError):
+        utils.make_request("GET", "test", {}, {}, max_attempts=3, retry_client_errors=True)
+
+    assert mock_get.call_count == 3
+
+
+def test_make_request_retries_on_connection_errors(
+    requests_mock: RequestMocker, mocker: MockerFixture
+) -> None:
+    mocker.patch("time.sleep")
+    requests_mock.get(
+        utils.BASE_URL + "test",
+        [
+            {"exc": requests.ConnectionError},
+            {"exc": requests.Timeout},
+            {"json": {"success": "get"}, "status_code": 200},
+        ],
+    )
+
+    assert utils.make_request("GET", "test", {}, {}) == {"success": "get"}
+
+
+def test_make_request_raises_request_error_on_repeated_connection_errors(
+    requests_mock: RequestMocker, mocker: MockerFixture
+) -> None:
+    mocker.patch("time.sleep")
+    requests_mock.get(utils.BASE_URL + "test", exc=requests.ConnectionError)
+
+    with pytest.raises(RequestError):
+        utils.make_request("GET", "test", {}, {}, max_attempts=2)
+
+
 @pytest.mark.parametrize("error", [AirportCheckInError, RequestError])
 def test_make_request_stops_early_for_special_southwest_code(
     mocker: MockerFixture,
@@ -79,7 +203,7 @@ def test_make_request_does_not_sleep_randomly_on_failures_when_random_sleep_is_f
 ) -> None:
     mock_sleep = mocker.patch("time.sleep")
     mock_rand_sleep_duration = mocker.patch("lib.utils.random_sleep_duration")
-    requests_mock.post(utils.BASE_URL + "test", status_code=400, reason="error")
+    requests_mock.post(utils.BASE_URL + "test", status_code=500, reason="error")
 
     with pytest.raises(RequestError):
         utils.make_request("POST", "test", {}, {}, max_attempts=2, random_sleep=False)
@@ -122,12 +246,73 @@ def test_make_request_correctly_gets_data(requests_mock: RequestMocker) -> None:
     assert last_request.headers["header"] == "test"
 
 
+def test_make_request_uses_the_shared_session(mocker: MockerFixture) -> None:
+    mock_session = mocker.patch("lib.utils.SESSION")
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.json.return_value = {"success": "session"}
+
+    response = utils.make_request("GET", "test", {}, {})
+
+    assert response == {"success": "session"}
+    mock_session.get.assert_called_once_with(
+        utils.BASE_URL + "test", headers={}, params={}, timeout=utils.REQUEST_TIMEOUT
+    )
+
+
+def test_session_does_not_store_cookies(mocker: MockerFixture) -> None:
+    session = utils.create_session()
+    headers = http.client.HTTPMessage()
+    headers["Set-Cookie"] = "id=account1"
+    mock_raw_response = mocker.Mock()
+    mock_raw_response._original_response.msg = headers
+    request = requests.Request("GET", utils.BASE_URL + "test").prepare()
+
+    requests.cookies.extract_cookies_to_jar(session.cookies, request, mock_raw_response)
+
+    assert len(session.cookies) == 0
+
+
+def test_recreate_after_fork_replaces_the_object_in_forked_processes(
+    mocker: MockerFixture,
+) -> None:
+    mock_register_at_fork = mocker.patch("os.register_at_fork")
+    namespace = {"OBJECT": "parent_object"}
+
+    utils.recreate_after_fork(namespace, "OBJECT", lambda: "child_object")
+    assert namespace["OBJECT"] == "parent_object"
+
+    mock_register_at_fork.call_args.kwargs["after_in_child"]()
+    assert namespace["OBJECT"] == "child_object"
+
+
 def test_make_request_handles_malformed_URLs(requests_mock: RequestMocker) -> None:
     mock_post = requests_mock.get(utils.BASE_URL + "test/test2", status_code=200, text="{}")
     utils.make_request("GET", "/test//test2", {}, {})
     assert mock_post.last_request.url == utils.BASE_URL + "test/test2"
 
 
+def test_rate_limiter_does_not_wait_for_first_request(mocker: MockerFixture) -> None:
+    mock_sleep = mocker.patch("time.sleep")
+    mocker.patch("time.monotonic", return_value=100)
+
+    utils.RateLimiter(2).wait()
+
+    mock_sleep.assert_not_called()
+
+
+def test_rate_limiter_waits_between_requests(mocker: MockerFixture) -> None:
+    mock_sleep = mocker.patch("time.sleep")
+    mocker.patch("time.monotonic", side_effect=[100, 100.5, 101])
+    rate_limiter = utils.RateLimiter(2)
+
+    rate_limiter.wait()
+    rate_limiter.wait()
+    rate_limiter.wait()
+
+    # The third request waits for the second request's slot to pass as well
+    mock_sleep.assert_has_calls([call(1.5), call(3)])
+
+
 def test_get_current_time_returns_a_datetime_from_ntp_server(mocker: MockerFixture) -> None:
     ntp_stats = ntplib.NTPStats()
     ntp_stats.tx_timestamp = 3155673599